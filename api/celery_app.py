@@ -1,17 +1,38 @@
 """Celery application instance.
 
 Usage:
-    celery -A api.celery_app worker --loglevel=info
+    celery -A api.celery_app worker --loglevel=info -Q extraction
+    celery -A api.celery_app worker --loglevel=info -Q export --prefetch-multiplier 1
+
+Extraction tasks are short and I/O-bound (LLM + HTTP), so workers prefetch
+several messages to amortize broker round-trips. Exports are long-running and
+should be consumed by a separate worker with a prefetch of 1.
+
+With WORKER_PRELOAD_EMBEDDINGS the worker loads Sentence-BERT before forking
+its pool, so the pool processes share one copy of the weights.
 """
 
+import structlog
 from celery import Celery
+from celery.signals import worker_init
 
-from api.config import settings
+from api.config import configure_logging, settings
+
+configure_logging()
+logger = structlog.get_logger()
 
 app = Celery(
     "neuroweave",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
+    # Imported by worker/beat processes at startup only, so importing this
+    # module (e.g. from the API to call .delay) stays cheap.
+    include=[
+        "api.tasks.process_messages",
+        "api.tasks.generate_article",
+        "api.tasks.export_dataset",
+        "api.tasks.fetch_github_discussions",
+    ],
 )
 
 app.conf.update(
@@ -22,7 +43,7 @@ app.conf.update(
     enable_utc=True,
     task_track_started=True,
     task_acks_late=True,
-    worker_prefetch_multiplier=1,
+    worker_prefetch_multiplier=settings.CELERY_PREFETCH_MULTIPLIER,
     task_routes={
         "api.tasks.process_messages.*": {"queue": "extraction"},
         "api.tasks.generate_article.*": {"queue": "extraction"},
@@ -37,10 +58,12 @@ app.conf.update(
     },
 )
 
-app.autodiscover_tasks(["api.tasks"])
 
-# Explicit imports to ensure tasks are always registered
-import api.tasks.process_messages  # noqa: F401, E402
-import api.tasks.generate_article  # noqa: F401, E402
-import api.tasks.export_dataset  # noqa: F401, E402
-import api.tasks.fetch_github_discussions  # noqa: F401, E402
+@worker_init.connect
+def _preload_embeddings(**kwargs) -> None:
+    # Runs in the prefork parent, before the pool processes are started
+    if not settings.WORKER_PRELOAD_EMBEDDINGS:
+        return
+    from api.services.embeddings import preload_for_fork
+
+    logger.info("embeddings_preloaded", shared=preload_for_fork())
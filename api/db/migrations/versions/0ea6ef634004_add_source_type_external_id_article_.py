@@ -5,13 +5,15 @@ Revises: 164635a24ce9
 Create Date: 2026-02-23 17:35:34.688392
 
 Three-phase migration:
-1. Add new columns as NULLABLE
-2. Backfill from existing discord_id columns
+1. Add new columns — constant-default columns are added NOT NULL with a
+   server default (PG 11+ stores it in the catalog, no table rewrite);
+   the rest are added NULLABLE
+2. Backfill from existing discord_id columns (batched, committed per batch)
 3. Set NOT NULL + add constraints
 """
 from typing import Sequence, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
@@ -21,15 +23,47 @@ down_revision: Union[str, None] = '164635a24ce9'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+BACKFILL_BATCH_SIZE = 10_000
+
+
+def _backfill(table: str, assignments: str, null_column: str) -> None:
+    """Backfill rows where null_column IS NULL in batches of BACKFILL_BATCH_SIZE.
+
+    Pending PKs are snapshotted into a temp table once, so each batch is an
+    indexed PK lookup instead of a rescan for NULLs. Must run inside an
+    autocommit block so every batch commits on its own (bounded locks and WAL).
+    """
+    if context.is_offline_mode():
+        op.execute(f"UPDATE {table} SET {assignments} WHERE {null_column} IS NULL")
+        return
+
+    todo = f"_{table}_backfill"
+    conn = op.get_bind()
+    conn.execute(sa.text(f"CREATE TEMP TABLE {todo} AS SELECT id FROM {table} WHERE {null_column} IS NULL"))
+    conn.execute(sa.text(f"CREATE INDEX ON {todo} (id)"))
+
+    batch_update = sa.text(f"""
+        WITH batch AS (
+            DELETE FROM {todo}
+            WHERE id IN (SELECT id FROM {todo} ORDER BY id LIMIT :limit)
+            RETURNING id
+        )
+        UPDATE {table} SET {assignments} FROM batch WHERE {table}.id = batch.id
+    """)
+    while conn.execute(sa.text(f"SELECT EXISTS (SELECT 1 FROM {todo})")).scalar():
+        conn.execute(batch_update, {"limit": BACKFILL_BATCH_SIZE})
+
+    conn.execute(sa.text(f"DROP TABLE {todo}"))
+
 
 def upgrade() -> None:
-    # === PHASE 1: Add columns as NULLABLE ===
+    # === PHASE 1: Add columns ===
 
     # servers
-    op.add_column('servers', sa.Column('source_type', sa.String(length=20), nullable=True))
+    op.add_column('servers', sa.Column('source_type', sa.String(length=20), nullable=False, server_default='discord'))
     op.add_column('servers', sa.Column('external_id', sa.String(length=200), nullable=True))
     op.add_column('servers', sa.Column('source_url', sa.Text(), nullable=True))
-    op.add_column('servers', sa.Column('source_metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.add_column('servers', sa.Column('source_metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default='{}'))
 
     # channels
     op.add_column('channels', sa.Column('external_id', sa.String(length=200), nullable=True))
@@ -38,45 +72,48 @@ def upgrade() -> None:
     op.add_column('messages', sa.Column('external_id', sa.String(length=200), nullable=True))
 
     # articles
-    op.add_column('articles', sa.Column('article_type', sa.String(length=30), nullable=True))
-    op.add_column('articles', sa.Column('source_type', sa.String(length=20), nullable=True))
+    op.add_column('articles', sa.Column('article_type', sa.String(length=30), nullable=False, server_default='troubleshooting'))
+    op.add_column('articles', sa.Column('source_type', sa.String(length=20), nullable=False, server_default='discord'))
     op.add_column('articles', sa.Column('source_url', sa.Text(), nullable=True))
 
     # === PHASE 2: Backfill existing data ===
 
-    op.execute("UPDATE servers SET source_type = 'discord', external_id = discord_id, source_metadata = '{}' WHERE source_type IS NULL")
-    op.execute("UPDATE channels SET external_id = discord_id WHERE external_id IS NULL")
-    op.execute("UPDATE messages SET external_id = discord_message_id WHERE external_id IS NULL")
-    op.execute("UPDATE articles SET article_type = 'troubleshooting', source_type = 'discord' WHERE article_type IS NULL")
+    with op.get_context().autocommit_block():
+        _backfill("servers", "external_id = discord_id", "external_id")
+        _backfill("channels", "external_id = discord_id", "external_id")
+        _backfill("messages", "external_id = discord_message_id", "external_id")
 
     # === PHASE 3: Set NOT NULL + constraints ===
 
     # servers
-    op.alter_column('servers', 'source_type', nullable=False, server_default='discord')
     op.alter_column('servers', 'external_id', nullable=False)
-    op.alter_column('servers', 'source_metadata', nullable=False, server_default='{}')
     op.alter_column('servers', 'discord_id', existing_type=sa.VARCHAR(length=32), nullable=True)
-    op.create_index(op.f('ix_servers_source_type'), 'servers', ['source_type'], unique=False)
-    op.create_index(op.f('ix_servers_external_id'), 'servers', ['external_id'], unique=False)
-    op.create_unique_constraint('uq_server_source_external', 'servers', ['source_type', 'external_id'])
 
     # channels
     op.alter_column('channels', 'external_id', nullable=False)
     op.alter_column('channels', 'discord_id', existing_type=sa.VARCHAR(length=32), nullable=True)
-    op.create_index(op.f('ix_channels_external_id'), 'channels', ['external_id'], unique=False)
-    op.create_unique_constraint('uq_channel_server_external', 'channels', ['server_id', 'external_id'])
 
     # messages
     op.alter_column('messages', 'external_id', nullable=False)
     op.alter_column('messages', 'discord_message_id', existing_type=sa.VARCHAR(length=32), nullable=True)
     op.alter_column('messages', 'reply_to_id', existing_type=sa.VARCHAR(length=32), type_=sa.String(length=200), existing_nullable=True)
-    op.create_index(op.f('ix_messages_external_id'), 'messages', ['external_id'], unique=False)
 
-    # articles
-    op.alter_column('articles', 'article_type', nullable=False, server_default='troubleshooting')
-    op.alter_column('articles', 'source_type', nullable=False, server_default='discord')
-    op.create_index(op.f('ix_articles_article_type'), 'articles', ['article_type'], unique=False)
-    op.create_index(op.f('ix_articles_source_type'), 'articles', ['source_type'], unique=False)
+    # Indexes are built CONCURRENTLY so ingest keeps writing during the scan.
+    # Unique constraints are attached to a concurrently-built unique index.
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_servers_source_type'), 'servers', ['source_type'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_servers_external_id'), 'servers', ['external_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('uq_server_source_external_idx', 'servers', ['source_type', 'external_id'], unique=True, postgresql_concurrently=True)
+        op.execute("ALTER TABLE servers ADD CONSTRAINT uq_server_source_external UNIQUE USING INDEX uq_server_source_external_idx")
+
+        op.create_index(op.f('ix_channels_external_id'), 'channels', ['external_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('uq_channel_server_external_idx', 'channels', ['server_id', 'external_id'], unique=True, postgresql_concurrently=True)
+        op.execute("ALTER TABLE channels ADD CONSTRAINT uq_channel_server_external UNIQUE USING INDEX uq_channel_server_external_idx")
+
+        op.create_index(op.f('ix_messages_external_id'), 'messages', ['external_id'], unique=False, postgresql_concurrently=True)
+
+        op.create_index(op.f('ix_articles_article_type'), 'articles', ['article_type'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_articles_source_type'), 'articles', ['source_type'], unique=False, postgresql_concurrently=True)
 
 
 def downgrade() -> None:
@@ -0,0 +1,39 @@
+"""add articles visible/created_at index
+
+Revision ID: 3f1c9a7d2b4e
+Revises: 0ea6ef634004
+Create Date: 2026-10-16 09:12:41.208113
+
+Supports the paginated article listing (WHERE is_visible ORDER BY created_at DESC).
+Built CONCURRENTLY so writes to articles are not blocked.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '3f1c9a7d2b4e'
+down_revision: Union[str, None] = '0ea6ef634004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_articles_visible_created_at',
+            'articles',
+            ['is_visible', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_articles_visible_created_at',
+            table_name='articles',
+            postgresql_concurrently=True,
+        )
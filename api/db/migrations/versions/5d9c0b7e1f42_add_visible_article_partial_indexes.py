@@ -0,0 +1,58 @@
+"""add visible-article partial indexes
+
+Revision ID: 5d9c0b7e1f42
+Revises: e4a7b3c2f105
+Create Date: 2026-10-16 13:02:44.906173
+
+Every article read filters on is_visible = true, so index only those rows.
+Replaces the (is_visible, created_at DESC) composite with a partial index on
+created_at DESC and adds partial indexes for the language and article_type
+filters. Built CONCURRENTLY so writes to articles are not blocked.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '5d9c0b7e1f42'
+down_revision: Union[str, None] = 'e4a7b3c2f105'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTIAL_INDEXES = (
+    ('ix_articles_visible_created', [sa.text('created_at DESC')]),
+    ('ix_articles_visible_language', ['language']),
+    ('ix_articles_visible_article_type', ['article_type']),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in PARTIAL_INDEXES:
+            op.create_index(
+                name,
+                'articles',
+                columns,
+                unique=False,
+                postgresql_where=sa.text('is_visible = true'),
+                postgresql_concurrently=True,
+            )
+        op.drop_index(
+            'ix_articles_visible_created_at',
+            table_name='articles',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_articles_visible_created_at',
+            'articles',
+            ['is_visible', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        for name, _ in PARTIAL_INDEXES:
+            op.drop_index(name, table_name='articles', postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""add articles tags GIN index
+
+Revision ID: 7b2e5d91c4a8
+Revises: 3f1c9a7d2b4e
+Create Date: 2026-10-16 11:04:27.513920
+
+Lets the tag filter (tags && ARRAY[...]) use an index instead of a sequential scan.
+Built CONCURRENTLY so writes to articles are not blocked.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '7b2e5d91c4a8'
+down_revision: Union[str, None] = '3f1c9a7d2b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_articles_tags_gin',
+            'articles',
+            ['tags'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_articles_tags_gin',
+            table_name='articles',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,40 @@
+"""add threads channel/status index
+
+Revision ID: 8a3f6c1d2e97
+Revises: 5d9c0b7e1f42
+Create Date: 2026-10-16 13:40:18.552071
+
+Supports the per-server thread counts in the stats endpoint
+(WHERE channel_id IN (...) AND status = ...). Built CONCURRENTLY so writes
+to threads are not blocked.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '8a3f6c1d2e97'
+down_revision: Union[str, None] = '5d9c0b7e1f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_threads_channel_status',
+            'threads',
+            ['channel_id', 'status'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_threads_channel_status',
+            table_name='threads',
+            postgresql_concurrently=True,
+        )
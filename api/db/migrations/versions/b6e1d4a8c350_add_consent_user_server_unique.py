@@ -0,0 +1,36 @@
+"""add consent_records (user_hash, server_id) unique constraint
+
+Revision ID: b6e1d4a8c350
+Revises: 8a3f6c1d2e97
+Create Date: 2026-10-16 14:21:36.174509
+
+Backs the INSERT ... ON CONFLICT upsert in create_consent. Duplicate rows
+left by the old select-then-insert race are collapsed to the newest one
+first. The unique index is built CONCURRENTLY and then attached as the
+constraint.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b6e1d4a8c350'
+down_revision: Union[str, None] = '8a3f6c1d2e97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "DELETE FROM consent_records a USING consent_records b "
+        "WHERE a.user_hash = b.user_hash AND a.server_id = b.server_id AND a.id < b.id"
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index('uq_consent_user_server_idx', 'consent_records', ['user_hash', 'server_id'], unique=True, postgresql_concurrently=True)
+        op.execute("ALTER TABLE consent_records ADD CONSTRAINT uq_consent_user_server UNIQUE USING INDEX uq_consent_user_server_idx")
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_consent_user_server', 'consent_records', type_='unique')
@@ -0,0 +1,45 @@
+"""add embedding HNSW indexes
+
+Revision ID: c81f4e2a9d63
+Revises: 7b2e5d91c4a8
+Create Date: 2026-10-16 11:38:52.740611
+
+Approximate nearest-neighbour indexes for cosine distance on article and
+message embeddings. Built CONCURRENTLY so writes are not blocked.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c81f4e2a9d63'
+down_revision: Union[str, None] = '7b2e5d91c4a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HNSW_INDEXES = (
+    ('ix_articles_embedding_hnsw', 'articles'),
+    ('ix_messages_embedding_hnsw', 'messages'),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in HNSW_INDEXES:
+            op.create_index(
+                name,
+                table,
+                ['embedding'],
+                unique=False,
+                postgresql_using='hnsw',
+                postgresql_with={'m': 16, 'ef_construction': 64},
+                postgresql_ops={'embedding': 'vector_cosine_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in HNSW_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
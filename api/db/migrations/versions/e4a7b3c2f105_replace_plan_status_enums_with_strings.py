@@ -0,0 +1,68 @@
+"""replace plan/status enums with strings
+
+Revision ID: e4a7b3c2f105
+Revises: c81f4e2a9d63
+Create Date: 2026-10-16 12:15:09.318442
+
+servers.plan and threads.status move from native ENUM types to varchar(20)
+guarded by CHECK constraints, so adding a value no longer needs ALTER TYPE.
+The enums stored member names (FREE, RESOLVED, ...); the columns now hold
+the lower-case values used by ServerPlan / ThreadStatus.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e4a7b3c2f105'
+down_revision: Union[str, None] = 'c81f4e2a9d63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PLANS = ('free', 'pro', 'enterprise')
+STATUSES = ('pending', 'processing', 'resolved', 'noise', 'incomplete', 'failed')
+
+
+def _in_list(column: str, values: tuple[str, ...]) -> str:
+    return f"{column} IN ({', '.join(repr(v) for v in values)})"
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'servers', 'plan',
+        type_=sa.String(length=20),
+        postgresql_using='lower(plan::text)',
+        existing_nullable=False,
+    )
+    op.create_check_constraint('ck_server_plan', 'servers', _in_list('plan', PLANS))
+    op.execute('DROP TYPE serverplan')
+
+    op.alter_column(
+        'threads', 'status',
+        type_=sa.String(length=20),
+        postgresql_using='lower(status::text)',
+        existing_nullable=False,
+    )
+    op.create_check_constraint('ck_thread_status', 'threads', _in_list('status', STATUSES))
+    op.execute('DROP TYPE threadstatus')
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_thread_status', 'threads', type_='check')
+    op.execute(f"CREATE TYPE threadstatus AS ENUM ({', '.join(repr(s.upper()) for s in STATUSES)})")
+    op.alter_column(
+        'threads', 'status',
+        type_=sa.Enum(*(s.upper() for s in STATUSES), name='threadstatus'),
+        postgresql_using='upper(status)::threadstatus',
+        existing_nullable=False,
+    )
+
+    op.drop_constraint('ck_server_plan', 'servers', type_='check')
+    op.execute(f"CREATE TYPE serverplan AS ENUM ({', '.join(repr(p.upper()) for p in PLANS)})")
+    op.alter_column(
+        'servers', 'plan',
+        type_=sa.Enum(*(p.upper() for p in PLANS), name='serverplan'),
+        postgresql_using='upper(plan)::serverplan',
+        existing_nullable=False,
+    )
@@ -0,0 +1,50 @@
+"""add articles fts generated column
+
+Revision ID: f2c8a5e7b913
+Revises: b6e1d4a8c350
+Create Date: 2026-10-16 15:03:12.661840
+
+Stores the search tsvector as a generated column with a GIN index instead of
+tokenizing thread_summary/symptom/solution per row at query time.
+Adding a STORED generated column rewrites articles under an exclusive lock;
+the GIN index is then built CONCURRENTLY.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'f2c8a5e7b913'
+down_revision: Union[str, None] = 'b6e1d4a8c350'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FTS_EXPRESSION = (
+    "to_tsvector('english'::regconfig, "
+    "coalesce(thread_summary, '') || ' ' || coalesce(symptom, '') || ' ' || coalesce(solution, ''))"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        'articles',
+        sa.Column('fts', postgresql.TSVECTOR(), sa.Computed(FTS_EXPRESSION, persisted=True)),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_articles_fts',
+            'articles',
+            ['fts'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_articles_fts', table_name='articles', postgresql_concurrently=True)
+    op.drop_column('articles', 'fts')
@@ -7,13 +7,18 @@ Usage in routers:
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import hashlib
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Annotated
 
+import httpx
+import jwt
 import redis.asyncio as aioredis
-from fastapi import Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.config import settings
@@ -22,27 +27,38 @@ from api.db.session import async_session_factory
 # --- Database ---
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Provide an async database session."""
+    """Provide an async database session.
+
+    Does not commit: write endpoints call ``await db.commit()`` themselves, so
+    read-only requests skip the COMMIT round-trip.
+    """
     async with async_session_factory() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Provide a session whose transaction is READ ONLY, for GET endpoints."""
+    async with async_session_factory() as session:
+        await session.execute(text("SET TRANSACTION READ ONLY"))
+        yield session
+
+
 # --- Redis ---
 
-_redis_pool: aioredis.Redis | None = None
+async def get_redis(request: Request) -> aioredis.Redis:
+    """Provide the shared Redis client created in the app lifespan."""
+    return request.app.state.redis
 
 
-async def get_redis() -> aioredis.Redis:
-    """Provide a Redis connection from the pool."""
-    global _redis_pool
-    if _redis_pool is None:
-        _redis_pool = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
-    return _redis_pool
+# --- HTTP ---
+
+async def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Provide the shared outbound httpx client created in the app lifespan."""
+    return request.app.state.http
 
 
 # --- Auth ---
@@ -51,19 +67,35 @@ security = HTTPBearer(auto_error=False)
 
 ALGORITHM = "HS256"
 
+# Bound once at import so the hot path does no per-request setup
+JWT_KEY = settings.APP_SECRET_KEY.encode()
+_JWT_ALGORITHMS = (ALGORITHM,)
+_JWT_OPTIONS = {"require": ["exp"]}
+
+# Decoded payloads keyed by token digest. Only successful decodes are cached,
+# and exp is re-checked on every hit so expired tokens are still rejected.
+_token_cache: TTLCache[bytes, dict] = TTLCache(maxsize=10_000, ttl=60)
+
 
 def _decode_token(token: str) -> dict:
     """Decode and validate a JWT token."""
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(cache_key)
+    if cached is not None and cached.get("exp", 0) > time.time():
+        return cached
+
     try:
-        payload = jwt.decode(token, settings.APP_SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError as e:
+        payload = jwt.decode(token, JWT_KEY, algorithms=_JWT_ALGORITHMS, options=_JWT_OPTIONS)
+    except jwt.InvalidTokenError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid token: {e}",
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
+    _token_cache[cache_key] = payload
+    return payload
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
@@ -94,8 +126,42 @@ async def get_optional_user(
         return None
 
 
+# --- Conditional GET ---
+
+def etag_for(model) -> Callable[..., Awaitable[None]]:
+    """Build a dependency that answers 304 when ``model``'s table has not changed.
+
+    The ETag covers max(updated_at) and the row count, so inserts, updates and
+    deletes all change it. Usage: ``@router.get(..., dependencies=[Depends(etag_for(Server))])``.
+    """
+
+    async def check_etag(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_read_db),
+    ) -> None:
+        result = await db.execute(
+            select(func.max(model.updated_at), func.count()).select_from(model)
+        )
+        last_modified, count = result.one()
+        digest = hashlib.blake2b(f"{last_modified}:{count}".encode(), digest_size=16).hexdigest()
+        etag = f'"{digest}"'
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or etag in (tag.strip() for tag in if_none_match.split(","))
+        ):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+    return check_etag
+
+
 # Type aliases for cleaner router signatures
 DB = Annotated[AsyncSession, Depends(get_db)]
+ReadDB = Annotated[AsyncSession, Depends(get_read_db)]
 Redis = Annotated[aioredis.Redis, Depends(get_redis)]
+HttpClient = Annotated[httpx.AsyncClient, Depends(get_http_client)]
 CurrentUser = Annotated[dict, Depends(get_current_user)]
 OptionalUser = Annotated[dict | None, Depends(get_optional_user)]
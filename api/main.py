@@ -1,19 +1,27 @@
 """NeuroWeave FastAPI application.
 
 Entry point: uvicorn api.main:app --reload
+Production:  uvicorn api.main:app --loop uvloop --http httptools --workers N
+             (or `python -m api.main`, which does the same with one worker per CPU)
 """
 
 from __future__ import annotations
 
+import os
 from contextlib import asynccontextmanager
 
+import httpx
+import redis.asyncio as aioredis
 import structlog
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
 
-from api.config import settings
+from api.config import configure_logging, settings
 
+configure_logging()
 logger = structlog.get_logger()
 
 
@@ -21,10 +29,25 @@ logger = structlog.get_logger()
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
     logger.info("app_startup", env=settings.APP_ENV)
+    app.state.redis = aioredis.from_url(
+        settings.REDIS_URL, decode_responses=True, max_connections=50
+    )
+    # Response cache; fastapi-cache stores bytes, so it gets its own non-decoding client
+    app.state.cache_redis = aioredis.from_url(settings.REDIS_URL, max_connections=20)
+    FastAPICache.init(RedisBackend(app.state.cache_redis), prefix="nw")
+    # Shared outbound HTTP client (Discord OAuth etc.) so connections are reused
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=10.0,
+    )
     yield
     # Shutdown: close DB connections, Redis pool, etc.
     from api.db.session import engine
 
+    await app.state.http.aclose()
+    await app.state.redis.aclose()
+    await app.state.cache_redis.aclose()
     await engine.dispose()
     logger.info("app_shutdown")
 
@@ -34,6 +57,7 @@ app = FastAPI(
     description="Technical knowledge extraction from Discord",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.APP_ENV == "development" else None,
     redoc_url="/redoc" if settings.APP_ENV == "development" else None,
 )
@@ -41,19 +65,20 @@ app = FastAPI(
 # --- CORS ---
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS.split(","),
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type", "x-requested-with"],
+    max_age=86400,
 )
 
 
 # --- Exception handlers ---
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     logger.error("unhandled_exception", path=request.url.path, error=str(exc))
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error"},
     )
@@ -85,3 +110,16 @@ app.include_router(github_router, prefix="/api", tags=["github"])
 @app.get("/api/health")
 async def health_check():
     return {"status": "ok", "version": "0.1.0"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
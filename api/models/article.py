@@ -1,8 +1,8 @@
 import enum
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Float, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import Computed, Float, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from api.models.base import Base, TimestampMixin
@@ -17,6 +17,29 @@ class ArticleType(str, enum.Enum):
 
 class Article(Base, TimestampMixin):
     __tablename__ = "articles"
+    __table_args__ = (
+        # Partial indexes: reads only ever touch visible articles
+        Index(
+            "ix_articles_visible_created",
+            text("created_at DESC"),
+            postgresql_where=text("is_visible = true"),
+        ),
+        Index("ix_articles_visible_language", "language", postgresql_where=text("is_visible = true")),
+        Index(
+            "ix_articles_visible_article_type",
+            "article_type",
+            postgresql_where=text("is_visible = true"),
+        ),
+        Index("ix_articles_tags_gin", "tags", postgresql_using="gin"),
+        Index("ix_articles_fts", "fts", postgresql_using="gin"),
+        Index(
+            "ix_articles_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     thread_id: Mapped[int] = mapped_column(
@@ -36,6 +59,16 @@ class Article(Base, TimestampMixin):
     thread_summary: Mapped[str] = mapped_column(Text, nullable=False)
     quality_score: Mapped[float] = mapped_column(Float, nullable=False)
     embedding = mapped_column(Vector(384))
+    # Search document, maintained by Postgres; deferred so ORM loads skip it
+    fts = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english'::regconfig, coalesce(thread_summary, '') || ' ' || "
+            "coalesce(symptom, '') || ' ' || coalesce(solution, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     is_visible: Mapped[bool] = mapped_column(default=True)
 
     thread = relationship("Thread", back_populates="article")
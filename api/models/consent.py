@@ -1,13 +1,20 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from api.models.base import Base
 
+# Redis counter bumped on every consent change; workers key their cached
+# consent sets on it so a revocation invalidates them immediately.
+CONSENT_VERSION_KEY = "consent:version"
+
 
 class ConsentRecord(Base):
     __tablename__ = "consent_records"
+    __table_args__ = (
+        UniqueConstraint("user_hash", "server_id", name="uq_consent_user_server"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import BigInteger, Enum, String, Text, UniqueConstraint
+from sqlalchemy import BigInteger, CheckConstraint, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +23,7 @@ class Server(Base, TimestampMixin):
     __tablename__ = "servers"
     __table_args__ = (
         UniqueConstraint("source_type", "external_id", name="uq_server_source_external"),
+        CheckConstraint("plan IN ('free', 'pro', 'enterprise')", name="ck_server_plan"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -35,8 +36,6 @@ class Server(Base, TimestampMixin):
     member_count: Mapped[int] = mapped_column(BigInteger, default=0)
     settings: Mapped[dict] = mapped_column(JSONB, default=dict)
     source_metadata: Mapped[dict] = mapped_column(JSONB, default=dict)
-    plan: Mapped[ServerPlan] = mapped_column(
-        Enum(ServerPlan), default=ServerPlan.FREE, nullable=False
-    )
+    plan: Mapped[str] = mapped_column(String(20), default=ServerPlan.FREE.value, nullable=False)
 
     channels = relationship("Channel", back_populates="server", cascade="all, delete-orphan")
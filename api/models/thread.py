@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import Enum, ForeignKey, String
+from sqlalchemy import CheckConstraint, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,14 +18,21 @@ class ThreadStatus(str, enum.Enum):
 
 class Thread(Base, TimestampMixin):
     __tablename__ = "threads"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending', 'processing', 'resolved', 'noise', 'incomplete', 'failed')",
+            name="ck_thread_status",
+        ),
+        Index("ix_threads_channel_status", "channel_id", "status"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     channel_id: Mapped[int] = mapped_column(
         ForeignKey("channels.id", ondelete="CASCADE"), nullable=False, index=True
     )
     message_ids: Mapped[list[str]] = mapped_column(ARRAY(String(32)), default=list)
-    status: Mapped[ThreadStatus] = mapped_column(
-        Enum(ThreadStatus), default=ThreadStatus.PENDING, nullable=False, index=True
+    status: Mapped[str] = mapped_column(
+        String(20), default=ThreadStatus.PENDING.value, nullable=False, index=True
     )
     cluster_metadata: Mapped[dict] = mapped_column(JSONB, default=dict)
     checkpoint_thread_id: Mapped[str | None] = mapped_column(String(200), unique=True)
@@ -3,37 +3,60 @@
 Endpoints:
   GET /api/servers/{server_id}/articles — list articles for a server
   GET /api/articles/{article_id}        — get single article
+  PATCH /api/articles/moderate              — bulk hide/show articles (admin)
   PATCH /api/articles/{article_id}/moderate — hide/show article (admin)
 """
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Query, status
-from sqlalchemy import func, select
+import msgspec
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import raiseload
 
-from api.deps import DB, CurrentUser
+from api.deps import DB, CurrentUser, ReadDB
 from api.models.article import Article
 from api.models.channel import Channel
-from api.schemas.article import ArticleBrief, ArticleListResponse, ArticleResponse
+from api.models.thread import Thread
+from api.schemas.article import (
+    ArticleBriefItem,
+    ArticleListPage,
+    ArticleListResponse,
+    ArticleModerateRequest,
+    ArticleModerateResponse,
+    ArticleResponse,
+)
 
 router = APIRouter()
 
+# Only the columns the list serializes, in ArticleBriefItem field order; skips the
+# embedding and long text fields.
+_BRIEF_COLUMNS = tuple(getattr(Article, name) for name in ArticleBriefItem.__struct_fields__)
+# ArticleResponse doesn't read Article.thread; fail loudly instead of lazy-loading it.
+_NO_THREAD = raiseload(Article.thread)
+
+_article_list_encoder = msgspec.json.Encoder()
+
 
 @router.get("/servers/{server_id}/articles", response_model=ArticleListResponse)
 async def list_server_articles(
     server_id: int,
-    db: DB,
+    db: ReadDB,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     language: str | None = None,
     tag: str | None = None,
 ):
-    """List articles for a server with optional filtering."""
+    """List articles for a server with optional filtering.
+
+    Rows are encoded with msgspec and returned as a raw Response, skipping
+    FastAPI's response_model validation; response_model is kept for OpenAPI.
+    """
     # Base query: articles joined through threads → channels → server
     base_query = (
-        select(Article)
-        .join(Article.thread)
-        .join(Channel, Channel.id == Article.thread.property.mapper.class_.channel_id)
+        select(*_BRIEF_COLUMNS)
+        .join(Thread, Thread.id == Article.thread_id)
+        .join(Channel, Channel.id == Thread.channel_id)
         .where(Channel.server_id == server_id)
         .where(Article.is_visible.is_(True))
     )
@@ -41,35 +64,44 @@ async def list_server_articles(
     if language:
         base_query = base_query.where(Article.language == language)
     if tag:
-        base_query = base_query.where(Article.tags.any(tag))
+        # Array overlap (&&) is served by ix_articles_tags_gin; ANY() is not
+        base_query = base_query.where(Article.tags.overlap([tag]))
 
-    # Count total
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total = (await db.execute(count_query)).scalar() or 0
-
-    # Paginate
+    # Single round-trip: total comes from a window count on every row
     query = (
         base_query
+        .add_columns(func.count().over().label("total"))
         .order_by(Article.created_at.desc())
         .offset((page - 1) * page_size)
         .limit(page_size)
     )
-    result = await db.execute(query)
-    articles = result.scalars().all()
-
-    return ArticleListResponse(
-        items=[ArticleBrief.model_validate(a) for a in articles],
+    rows = (await db.execute(query)).all()
+
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        # Page past the end: no rows to carry the window count
+        count_query = select(func.count()).select_from(base_query.subquery())
+        total = (await db.execute(count_query)).scalar() or 0
+    else:
+        total = 0
+
+    page_body = ArticleListPage(
+        items=[ArticleBriefItem(*row[:-1]) for row in rows],
         total=total,
         page=page,
         page_size=page_size,
     )
+    return Response(content=_article_list_encoder.encode(page_body), media_type="application/json")
 
 
 @router.get("/articles/{article_id}", response_model=ArticleResponse)
-async def get_article(article_id: int, db: DB):
+async def get_article(article_id: int, db: ReadDB):
     """Get a single article by ID."""
     result = await db.execute(
-        select(Article).where(Article.id == article_id, Article.is_visible.is_(True))
+        select(Article)
+        .options(_NO_THREAD)
+        .where(Article.id == article_id, Article.is_visible.is_(True))
     )
     article = result.scalar_one_or_none()
 
@@ -87,11 +119,32 @@ async def moderate_article(
     user: CurrentUser,
 ):
     """Hide or show an article (admin only)."""
-    result = await db.execute(select(Article).where(Article.id == article_id))
-    article = result.scalar_one_or_none()
-
-    if not article:
+    result = await db.execute(
+        update(Article)
+        .where(Article.id == article_id)
+        .values(is_visible=is_visible)
+        .returning(Article.id)
+    )
+    if result.first() is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Article not found")
 
-    article.is_visible = is_visible
+    await db.commit()
     return {"id": article_id, "is_visible": is_visible}
+
+
+@router.patch("/articles/moderate", response_model=ArticleModerateResponse)
+async def moderate_articles(body: ArticleModerateRequest, db: DB, user: CurrentUser):
+    """Hide or show many articles in one statement (admin only).
+
+    Returns the IDs that were actually updated; unknown IDs are skipped.
+    """
+    result = await db.execute(
+        update(Article)
+        .where(Article.id.in_(body.ids))
+        .values(is_visible=body.is_visible)
+        .returning(Article.id)
+    )
+    updated_ids = list(result.scalars())
+
+    await db.commit()
+    return ArticleModerateResponse(ids=updated_ids, is_visible=body.is_visible)
@@ -8,20 +8,21 @@ Flow:
 
 from __future__ import annotations
 
-import json
+import asyncio
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
 
 import httpx
+import jwt
+import orjson
 import structlog
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import RedirectResponse
-from jose import jwt
 
 from api.config import settings
-from api.deps import ALGORITHM, CurrentUser
+from api.deps import ALGORITHM, JWT_KEY, CurrentUser, HttpClient
 
-FRONTEND_URL = settings.CORS_ORIGINS.split(",")[0]  # http://localhost:3000
+FRONTEND_URL = settings.CORS_ORIGINS[0]  # http://localhost:3000
 
 logger = structlog.get_logger()
 
@@ -32,42 +33,83 @@ DISCORD_OAUTH_AUTHORIZE = "https://discord.com/api/oauth2/authorize"
 DISCORD_OAUTH_TOKEN = "https://discord.com/api/oauth2/token"
 REDIRECT_URI = "http://localhost:8000/api/auth/discord/callback"
 
+# Built once: these only depend on settings
+_DISCORD_REDIRECT_URL = (
+    f"{DISCORD_OAUTH_AUTHORIZE}?"
+    + urlencode({
+        "client_id": settings.DISCORD_CLIENT_ID,
+        "redirect_uri": REDIRECT_URI,
+        "response_type": "code",
+        "scope": "identify guilds",
+    })
+    if settings.DISCORD_CLIENT_ID
+    else None
+)
+_TOKEN_POST_BASE = {
+    "client_id": settings.DISCORD_CLIENT_ID,
+    "client_secret": settings.DISCORD_CLIENT_SECRET,
+    "grant_type": "authorization_code",
+    "redirect_uri": REDIRECT_URI,
+}
+
 JWT_EXPIRY_HOURS = 168  # 7 days
+_JWT_TTL = timedelta(hours=JWT_EXPIRY_HOURS)
 
 
 def _create_jwt(user_data: dict) -> str:
     """Create a JWT token for the authenticated user."""
+    now = datetime.now(timezone.utc)
     payload = {
         "sub": user_data["id"],
         "discord_id": user_data["id"],
         "username": user_data.get("username", ""),
         "avatar": user_data.get("avatar"),
-        "exp": datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRY_HOURS),
-        "iat": datetime.now(timezone.utc),
+        "exp": now + _JWT_TTL,
+        "iat": now,
     }
-    return jwt.encode(payload, settings.APP_SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(payload, JWT_KEY, algorithm=ALGORITHM)
+
+
+async def _fetch_discord_profile(
+    http: httpx.AsyncClient, access_token: str
+) -> tuple[dict, list[str]]:
+    """Fetch the Discord user and their guild IDs."""
+    # Fetch user profile and guilds (servers) concurrently
+    auth_headers = {"Authorization": f"Bearer {access_token}"}
+    user_response, guilds_response = await asyncio.gather(
+        http.get(f"{DISCORD_API_BASE}/users/@me", headers=auth_headers),
+        http.get(f"{DISCORD_API_BASE}/users/@me/guilds", headers=auth_headers),
+    )
+
+    if user_response.status_code != 200:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Failed to fetch Discord user",
+        )
+
+    user_data = user_response.json()
+
+    guilds = []
+    if guilds_response.status_code == 200:
+        guilds = [g["id"] for g in guilds_response.json()]
+
+    return user_data, guilds
 
 
 @router.get("/discord")
 async def discord_oauth_redirect():
     """Redirect to Discord OAuth2 authorization page."""
-    if not settings.DISCORD_CLIENT_ID:
+    if _DISCORD_REDIRECT_URL is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Discord OAuth2 not configured",
         )
 
-    params = urlencode({
-        "client_id": settings.DISCORD_CLIENT_ID,
-        "redirect_uri": REDIRECT_URI,
-        "response_type": "code",
-        "scope": "identify guilds",
-    })
-    return {"redirect_url": f"{DISCORD_OAUTH_AUTHORIZE}?{params}"}
+    return {"redirect_url": _DISCORD_REDIRECT_URL}
 
 
 @router.get("/discord/callback")
-async def discord_oauth_callback(code: str):
+async def discord_oauth_callback(code: str, http: HttpClient):
     """Exchange OAuth2 code for Discord user data, return JWT.
 
     Args:
@@ -80,64 +122,36 @@ async def discord_oauth_callback(code: str):
         )
 
     # Exchange code for access token
-    async with httpx.AsyncClient() as client:
-        token_response = await client.post(
-            DISCORD_OAUTH_TOKEN,
-            data={
-                "client_id": settings.DISCORD_CLIENT_ID,
-                "client_secret": settings.DISCORD_CLIENT_SECRET,
-                "grant_type": "authorization_code",
-                "code": code,
-                "redirect_uri": REDIRECT_URI,
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
-
-        if token_response.status_code != 200:
-            logger.error("discord_token_exchange_failed", status=token_response.status_code)
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Failed to exchange Discord code",
-            )
-
-        token_data = token_response.json()
-        access_token = token_data["access_token"]
-
-        # Fetch user profile
-        user_response = await client.get(
-            f"{DISCORD_API_BASE}/users/@me",
-            headers={"Authorization": f"Bearer {access_token}"},
+    token_response = await http.post(
+        DISCORD_OAUTH_TOKEN,
+        data={**_TOKEN_POST_BASE, "code": code},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+
+    if token_response.status_code != 200:
+        logger.error("discord_token_exchange_failed", status=token_response.status_code)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Failed to exchange Discord code",
         )
 
-        if user_response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Failed to fetch Discord user",
-            )
+    token_data = token_response.json()
+    access_token = token_data["access_token"]
 
-        user_data = user_response.json()
+    user_data, guilds = await _fetch_discord_profile(http, access_token)
 
-        # Fetch user's guilds (servers)
-        guilds_response = await client.get(
-            f"{DISCORD_API_BASE}/users/@me/guilds",
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
-
-        guilds = []
-        if guilds_response.status_code == 200:
-            guilds = [g["id"] for g in guilds_response.json()]
-
-    jwt_token = _create_jwt(user_data)
+    # Signing runs in a worker thread so it never holds up the event loop
+    jwt_token = await asyncio.to_thread(_create_jwt, user_data)
 
     logger.info("discord_auth_success", user=user_data.get("username"))
 
     # Redirect to frontend with token and user data
-    user_json = json.dumps({
+    user_json = orjson.dumps({
         "id": user_data["id"],
         "username": user_data.get("username"),
         "avatar": user_data.get("avatar"),
         "guilds": guilds,
-    })
+    }).decode()
     params = urlencode({"token": jwt_token, "user": user_json})
     return RedirectResponse(url=f"{FRONTEND_URL}/auth/callback?{params}")
 
@@ -10,12 +10,15 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+import redis.asyncio as aioredis
 import structlog
 from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select, update
+from redis.exceptions import RedisError
+from sqlalchemy import literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from api.deps import DB
-from api.models.consent import ConsentRecord
+from api.deps import DB, ReadDB, Redis
+from api.models.consent import CONSENT_VERSION_KEY, ConsentRecord
 from api.schemas.consent import ConsentCreate, ConsentResponse, ConsentStatus
 
 logger = structlog.get_logger()
@@ -23,45 +26,59 @@ logger = structlog.get_logger()
 router = APIRouter()
 
 
+async def _bump_consent_version(redis: aioredis.Redis) -> None:
+    """Invalidate workers' cached consent sets after a committed change.
+
+    The change is already in the database, so a Redis failure must not fail the
+    request; workers then pick it up once their cached sets expire
+    (consent_checker.CONSENT_CACHE_TTL, 60s).
+    """
+    try:
+        await redis.incr(CONSENT_VERSION_KEY)
+    except RedisError as e:
+        logger.warning("consent_version_bump_failed", error=str(e))
+
+
 @router.post("/consent", response_model=ConsentResponse, status_code=status.HTTP_201_CREATED)
-async def create_consent(body: ConsentCreate, db: DB):
+async def create_consent(body: ConsentCreate, db: DB, redis: Redis):
     """Record a user's consent preferences for a server.
 
     If a consent record already exists for this user+server, update it.
     """
-    # Check if consent already exists
-    result = await db.execute(
-        select(ConsentRecord).where(
-            ConsentRecord.user_hash == body.user_hash,
-            ConsentRecord.server_id == body.server_id,
+    stmt = (
+        pg_insert(ConsentRecord)
+        .values(
+            user_hash=body.user_hash,
+            server_id=body.server_id,
+            kb_consent=body.kb_consent,
+            ai_consent=body.ai_consent,
         )
+        .on_conflict_do_update(
+            constraint="uq_consent_user_server",
+            set_={
+                "kb_consent": body.kb_consent,
+                "ai_consent": body.ai_consent,
+                "revoked_at": None,  # Re-granting clears revocation
+                "granted_at": datetime.now(timezone.utc),
+            },
+        )
+        # xmax is 0 only on a freshly inserted row, not on one the conflict updated
+        .returning(ConsentRecord, literal_column("xmax = 0").label("inserted"))
     )
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        existing.kb_consent = body.kb_consent
-        existing.ai_consent = body.ai_consent
-        existing.revoked_at = None  # Re-granting clears revocation
-        existing.granted_at = datetime.now(timezone.utc)
-        logger.info("consent_updated", user_hash=body.user_hash[:8], server=body.server_id)
-        return ConsentResponse.model_validate(existing)
-
-    record = ConsentRecord(
-        user_hash=body.user_hash,
-        server_id=body.server_id,
-        kb_consent=body.kb_consent,
-        ai_consent=body.ai_consent,
-    )
-    db.add(record)
-    await db.flush()
-    await db.refresh(record)
+    record, inserted = (await db.execute(stmt)).one()
+    await db.commit()
+    await _bump_consent_version(redis)
 
-    logger.info("consent_created", user_hash=body.user_hash[:8], server=body.server_id)
+    logger.info(
+        "consent_created" if inserted else "consent_updated",
+        user_hash=body.user_hash[:8],
+        server=body.server_id,
+    )
     return ConsentResponse.model_validate(record)
 
 
 @router.get("/consent/{user_hash}", response_model=ConsentStatus)
-async def get_consent(user_hash: str, db: DB):
+async def get_consent(user_hash: str, db: ReadDB):
     """Check consent status for a user across all servers."""
     result = await db.execute(
         select(ConsentRecord).where(ConsentRecord.user_hash == user_hash)
@@ -75,7 +92,9 @@ async def get_consent(user_hash: str, db: DB):
 
 
 @router.delete("/consent/{user_hash}", status_code=status.HTTP_200_OK)
-async def revoke_consent(user_hash: str, db: DB, server_id: int | None = None):
+async def revoke_consent(
+    user_hash: str, db: DB, redis: Redis, server_id: int | None = None
+):
     """Revoke consent for a user. Marks records as revoked.
 
     If server_id is provided, revokes only for that server.
@@ -86,26 +105,25 @@ async def revoke_consent(user_hash: str, db: DB, server_id: int | None = None):
     - Pending dataset exports are updated
     - Affected articles are re-generated without this user's contributions
     """
-    query = select(ConsentRecord).where(ConsentRecord.user_hash == user_hash)
+    stmt = update(ConsentRecord).where(ConsentRecord.user_hash == user_hash)
     if server_id:
-        query = query.where(ConsentRecord.server_id == server_id)
+        stmt = stmt.where(ConsentRecord.server_id == server_id)
+    stmt = stmt.values(
+        kb_consent=False,
+        ai_consent=False,
+        revoked_at=datetime.now(timezone.utc),
+    ).returning(ConsentRecord.id)
 
-    result = await db.execute(query)
-    consents = result.scalars().all()
+    result = await db.execute(stmt)
+    revoked_count = len(result.all())
 
-    if not consents:
+    if not revoked_count:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No consent records found for this user",
         )
-
-    now = datetime.now(timezone.utc)
-    revoked_count = 0
-    for consent in consents:
-        consent.kb_consent = False
-        consent.ai_consent = False
-        consent.revoked_at = now
-        revoked_count += 1
+    await db.commit()
+    await _bump_consent_version(redis)
 
     logger.info(
         "consent_revoked",
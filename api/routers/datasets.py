@@ -8,12 +8,14 @@ Endpoints:
 
 from __future__ import annotations
 
+import os
+
 import structlog
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import FileResponse
-from sqlalchemy import select
+from sqlalchemy import func, select
 
-from api.deps import DB, CurrentUser
+from api.deps import DB, CurrentUser, ReadDB, etag_for
 from api.models.dataset_export import DatasetExport
 from api.schemas.dataset import DatasetExportRequest, DatasetExportResponse, DatasetListResponse
 
@@ -21,6 +23,11 @@ logger = structlog.get_logger()
 
 router = APIRouter()
 
+# Plain column select for the list response; skips ORM instance construction.
+_EXPORT_COLUMNS = tuple(
+    getattr(DatasetExport, name) for name in DatasetExportResponse.model_fields
+)
+
 
 @router.post("/datasets/export", response_model=DatasetExportResponse, status_code=status.HTTP_202_ACCEPTED)
 async def trigger_export(body: DatasetExportRequest, db: DB, user: CurrentUser):
@@ -39,7 +46,8 @@ async def trigger_export(body: DatasetExportRequest, db: DB, user: CurrentUser):
         consent_verified=False,
     )
     db.add(export)
-    await db.flush()
+    # Commit before dispatch so the worker can see the row
+    await db.commit()
     await db.refresh(export)
 
     # Dispatch Celery task (import here to avoid circular deps)
@@ -61,27 +69,49 @@ async def trigger_export(body: DatasetExportRequest, db: DB, user: CurrentUser):
     return DatasetExportResponse.model_validate(export)
 
 
-@router.get("/datasets", response_model=DatasetListResponse)
+@router.get(
+    "/datasets",
+    response_model=DatasetListResponse,
+    dependencies=[Depends(etag_for(DatasetExport))],
+)
 async def list_exports(
-    db: DB,
+    db: ReadDB,
     server_id: int | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
 ):
     """List dataset exports, optionally filtered by server."""
-    query = select(DatasetExport).order_by(DatasetExport.created_at.desc())
+    base_query = select(*_EXPORT_COLUMNS)
     if server_id:
-        query = query.where(DatasetExport.server_id == server_id)
+        base_query = base_query.where(DatasetExport.server_id == server_id)
+
+    # Same single round-trip pattern as list_server_articles: window count per row
+    query = (
+        base_query
+        .add_columns(func.count().over().label("total"))
+        .order_by(DatasetExport.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    rows = (await db.execute(query)).all()
 
-    result = await db.execute(query)
-    exports = result.scalars().all()
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Offset past the end: no rows to carry the window count
+        count_query = select(func.count()).select_from(base_query.subquery())
+        total = (await db.execute(count_query)).scalar() or 0
+    else:
+        total = 0
 
     return DatasetListResponse(
-        items=[DatasetExportResponse.model_validate(e) for e in exports],
-        total=len(exports),
+        items=[DatasetExportResponse.model_validate(row._mapping) for row in rows],
+        total=total,
     )
 
 
 @router.get("/datasets/{export_id}/download")
-async def download_export(export_id: int, db: DB):
+async def download_export(export_id: int, db: ReadDB):
     """Download a completed dataset export file."""
     result = await db.execute(
         select(DatasetExport).where(DatasetExport.id == export_id)
@@ -97,8 +127,19 @@ async def download_export(export_id: int, db: DB):
             detail="Export is still processing",
         )
 
+    # Stat once here; FileResponse derives Content-Length/Last-Modified/ETag from it
+    try:
+        stat_result = os.stat(export.file_path)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export file not found",
+        ) from None
+
     return FileResponse(
         path=export.file_path,
         filename=f"neuroweave_export_{export.id}.{export.format}",
         media_type="application/octet-stream",
+        stat_result=stat_result,
+        headers={"Accept-Ranges": "bytes"},
     )
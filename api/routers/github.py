@@ -10,18 +10,26 @@ Endpoints:
 from __future__ import annotations
 
 import structlog
-from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import select
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import insert, select
 
-from api.deps import DB
+from api.deps import DB, ReadDB, etag_for
 from api.models.channel import Channel
 from api.models.server import Server
-from api.schemas.github import GitHubRepoCreate, GitHubRepoResponse, GitHubSyncResponse
+from api.schemas.github import (
+    GitHubRepoCreate,
+    GitHubRepoItem,
+    GitHubRepoResponse,
+    GitHubSyncResponse,
+)
 
 logger = structlog.get_logger()
 
 router = APIRouter()
 
+_repo_list_encoder = msgspec.json.Encoder()
+
 
 @router.post("/github/repos", response_model=GitHubRepoResponse, status_code=status.HTTP_201_CREATED)
 async def add_github_repo(body: GitHubRepoCreate, db: DB):
@@ -46,9 +54,8 @@ async def add_github_repo(body: GitHubRepoCreate, db: DB):
         from api.services.github_fetcher import GitHubDiscussionsFetcher
 
         if settings.GITHUB_TOKEN:
-            import asyncio
-            fetcher = GitHubDiscussionsFetcher(settings.GITHUB_TOKEN)
-            categories = await fetcher.fetch_categories(body.owner, body.repo)
+            async with GitHubDiscussionsFetcher(settings.GITHUB_TOKEN) as fetcher:
+                categories = await fetcher.fetch_categories(body.owner, body.repo)
     except Exception as e:
         logger.warning("github_categories_fetch_failed", error=str(e))
 
@@ -63,31 +70,31 @@ async def add_github_repo(body: GitHubRepoCreate, db: DB):
     db.add(server)
     await db.flush()
 
-    # Create channel records for categories
-    for cat in categories:
-        is_monitored = True
-        if body.category_filters:
-            is_monitored = cat.get("name", "") in body.category_filters
-
-        channel = Channel(
-            server_id=server.id,
-            external_id=cat["id"],
-            name=cat.get("name", "Unknown"),
-            is_monitored=is_monitored,
-        )
-        db.add(channel)
+    # Create channel records for categories in one multi-row INSERT
+    filters = set(body.category_filters) if body.category_filters else None
+    channel_rows = [
+        {
+            "server_id": server.id,
+            "external_id": cat["id"],
+            "name": cat.get("name", "Unknown"),
+            "is_monitored": filters is None or cat.get("name", "") in filters,
+        }
+        for cat in categories
+    ]
 
     # If no categories fetched, create a default "all" channel
-    if not categories:
-        channel = Channel(
-            server_id=server.id,
-            external_id="all",
-            name="All Discussions",
-            is_monitored=True,
-        )
-        db.add(channel)
-
-    await db.flush()
+    if not channel_rows:
+        channel_rows = [
+            {
+                "server_id": server.id,
+                "external_id": "all",
+                "name": "All Discussions",
+                "is_monitored": True,
+            }
+        ]
+
+    await db.execute(insert(Channel), channel_rows)
+    await db.commit()
 
     logger.info("github_repo_added", repo=external_id, categories=len(categories))
 
@@ -97,34 +104,60 @@ async def add_github_repo(body: GitHubRepoCreate, db: DB):
         name=server.name,
         source_type=server.source_type,
         source_url=server.source_url,
-        plan=server.plan.value if hasattr(server.plan, 'value') else str(server.plan),
+        plan=server.plan,
         categories=categories,
         created_at=server.created_at,
     )
 
 
-@router.get("/github/repos", response_model=list[GitHubRepoResponse])
-async def list_github_repos(db: DB):
-    """List all registered GitHub repo sources."""
+@router.get(
+    "/github/repos",
+    response_model=list[GitHubRepoResponse],
+    dependencies=[Depends(etag_for(Server))],
+)
+async def list_github_repos(db: ReadDB, response: Response):
+    """List all registered GitHub repo sources.
+
+    Encoded with msgspec and returned as a raw Response, skipping FastAPI's
+    response_model validation; response_model is kept for the OpenAPI schema.
+    """
+    # Only the two source_metadata keys the response needs, not the whole JSONB blob
     result = await db.execute(
-        select(Server).where(Server.source_type == "github").order_by(Server.created_at.desc())
+        select(
+            Server.id,
+            Server.external_id,
+            Server.name,
+            Server.source_type,
+            Server.source_url,
+            Server.plan,
+            Server.source_metadata["categories"].label("categories"),
+            Server.source_metadata["last_fetched_at"].astext.label("last_fetched_at"),
+            Server.created_at,
+        )
+        .where(Server.source_type == "github")
+        .order_by(Server.created_at.desc())
     )
-    servers = result.scalars().all()
-
-    return [
-        GitHubRepoResponse(
-            id=s.id,
-            external_id=s.external_id,
-            name=s.name,
-            source_type=s.source_type,
-            source_url=s.source_url,
-            plan=s.plan.value if hasattr(s.plan, 'value') else str(s.plan),
-            categories=s.source_metadata.get("categories", []) if s.source_metadata else [],
-            last_fetched_at=s.source_metadata.get("last_fetched_at") if s.source_metadata else None,
-            created_at=s.created_at,
+
+    items = [
+        GitHubRepoItem(
+            id=row.id,
+            external_id=row.external_id,
+            name=row.name,
+            source_type=row.source_type,
+            source_url=row.source_url,
+            plan=row.plan,
+            categories=row.categories or [],
+            last_fetched_at=row.last_fetched_at,
+            created_at=row.created_at,
         )
-        for s in servers
+        for row in result
     ]
+    # A returned Response does not inherit headers set by dependencies (ETag)
+    return Response(
+        content=_repo_list_encoder.encode(items),
+        media_type="application/json",
+        headers=dict(response.headers),
+    )
 
 
 @router.post("/github/repos/{server_id}/sync", response_model=GitHubSyncResponse)
@@ -157,6 +190,7 @@ async def delete_github_repo(server_id: int, db: DB):
 
     repo_name = server.external_id
     await db.delete(server)
+    await db.commit()
     logger.info("github_repo_deleted", repo=repo_name)
 
     return {"deleted": repo_name}
@@ -9,22 +9,54 @@ Endpoint:
 
 from __future__ import annotations
 
+import hashlib
+
+from cachetools import LRUCache
 from fastapi import APIRouter, Query
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
 from sqlalchemy import func, literal_column, select, text
 
-from api.deps import DB
+from api.deps import ReadDB
 from api.models.article import Article
 from api.models.channel import Channel
 from api.models.thread import Thread
 from api.schemas.article import ArticleBrief, SearchResponse, SearchResult
-from api.services.embeddings import encode
+from api.services.embeddings import encode_async
 
 router = APIRouter()
 
+SEARCH_CACHE_TTL = 60  # seconds
+# Stage-1 ANN candidate pool. An HNSW scan returns at most hnsw.ef_search rows,
+# so ef_search is raised to match.
+SEARCH_CANDIDATES = 200
+
+# Only what ArticleBrief serializes; the embedding stays inside the SQL expressions.
+_BRIEF_COLUMNS = tuple(getattr(Article, name) for name in ArticleBrief.model_fields)
+
+
+_query_embeddings: LRUCache[str, list[float]] = LRUCache(maxsize=4096)
+
+
+async def _cached_encode(q_norm: str) -> list[float]:
+    """Query embedding, memoized per process (the model lower-cases input anyway)."""
+    if (embedding := _query_embeddings.get(q_norm)) is None:
+        embedding = (await encode_async(q_norm)).tolist()
+        _query_embeddings[q_norm] = embedding
+    return embedding
+
+
+def _search_cache_key(func, namespace: str = "", *, request=None, response=None, args, kwargs):
+    """Key on the search parameters only; the default builder would also hash the DB session."""
+    params = (kwargs["q"], kwargs["server"], kwargs["language"], kwargs["source"], kwargs["limit"])
+    digest = hashlib.sha1(repr(params).encode()).hexdigest()
+    return f"{FastAPICache.get_prefix()}:search:{namespace}:{digest}"
+
 
 @router.get("/search", response_model=SearchResponse)
+@cache(expire=SEARCH_CACHE_TTL, key_builder=_search_cache_key)
 async def search_articles(
-    db: DB,
+    db: ReadDB,
     q: str = Query(..., min_length=1, max_length=500, description="Search query"),
     server: int | None = Query(None, description="Filter by server ID"),
     language: str | None = Query(None, description="Filter by language"),
@@ -34,13 +66,13 @@ async def search_articles(
     """Hybrid search: combine vector similarity + full-text relevance.
 
     1. Generate embedding for the query text
-    2. Compute cosine similarity against article embeddings (vector search)
-    3. Compute full-text search rank using PostgreSQL ts_rank
+    2. Take the nearest SEARCH_CANDIDATES articles by cosine distance (HNSW index)
+    3. For those candidates, compute full-text search rank using PostgreSQL ts_rank
     4. Combine scores: 0.6 * vector_score + 0.4 * fts_score
     5. Return top results sorted by combined score
     """
     # Generate query embedding
-    query_embedding = encode(q).tolist()
+    query_embedding = await _cached_encode(q.lower().strip())
 
     # Vector similarity score (1 - cosine distance = cosine similarity)
     vector_score = (
@@ -49,47 +81,55 @@ async def search_articles(
 
     # Full-text search score
     ts_query = func.plainto_tsquery("english", q)
-    fts_vector = func.to_tsvector(
-        "english",
-        func.concat(Article.thread_summary, " ", Article.symptom, " ", Article.solution),
-    )
-    fts_score = func.ts_rank(fts_vector, ts_query).label("fts_score")
+    fts_score = func.ts_rank(Article.fts, ts_query).label("fts_score")
 
     # Combined score
     combined_score = (literal_column("0.6") * vector_score + literal_column("0.4") * fts_score).label("score")
 
-    # Build query
-    query = (
-        select(Article, combined_score)
+    # Stage 1: ANN candidates, ordered by distance so the HNSW index is used
+    candidates = (
+        select(Article.id)
         .where(Article.is_visible.is_(True))
         .where(Article.embedding.isnot(None))
     )
 
     # Optional filters
     if source:
-        query = query.where(Article.source_type == source)
+        candidates = candidates.where(Article.source_type == source)
     if server:
-        query = (
-            query
+        candidates = (
+            candidates
             .join(Thread, Thread.id == Article.thread_id)
             .join(Channel, Channel.id == Thread.channel_id)
             .where(Channel.server_id == server)
         )
     if language:
-        query = query.where(Article.language == language)
+        candidates = candidates.where(Article.language == language)
 
-    query = query.order_by(text("score DESC")).limit(limit)
+    candidates = (
+        candidates
+        .order_by(Article.embedding.cosine_distance(query_embedding))
+        .limit(SEARCH_CANDIDATES)
+    )
+
+    # Stage 2: re-rank the candidates by the combined score
+    query = (
+        select(*_BRIEF_COLUMNS, combined_score)
+        .where(Article.id.in_(candidates.scalar_subquery()))
+        .order_by(text("score DESC"))
+        .limit(limit)
+    )
 
+    await db.execute(text(f"SET LOCAL hnsw.ef_search = {SEARCH_CANDIDATES}"))
     result = await db.execute(query)
     rows = result.all()
 
     search_results = []
     for row in rows:
-        article = row[0]
-        score = float(row[1]) if row[1] else 0.0
+        score = float(row.score) if row.score else 0.0
         search_results.append(
             SearchResult(
-                article=ArticleBrief.model_validate(article),
+                article=ArticleBrief.model_validate(row._mapping),
                 score=round(score, 4),
             )
         )
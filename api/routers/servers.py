@@ -8,11 +8,14 @@ Endpoints:
 
 from __future__ import annotations
 
+import asyncio
+
 import structlog
-from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func, select, text, update
 
-from api.deps import DB, CurrentUser
+from api.db.session import async_session_factory
+from api.deps import DB, CurrentUser, ReadDB, etag_for
 from api.models.article import Article
 from api.models.channel import Channel
 from api.models.message import Message
@@ -24,15 +27,30 @@ logger = structlog.get_logger()
 
 router = APIRouter()
 
+# Plain column selects for list responses: rows go straight into the schema
+# without building ORM instances.
+_SERVER_COLUMNS = tuple(getattr(Server, name) for name in ServerResponse.model_fields)
+
+
+async def _fetch_all(stmt) -> list:
+    """Run a read query on its own pooled, read-only session so queries can be gathered.
 
-@router.get("/servers", response_model=list[ServerResponse])
-async def list_servers(db: DB):
+    A single AsyncSession cannot run statements concurrently.
+    """
+    async with async_session_factory() as session:
+        await session.execute(text("SET TRANSACTION READ ONLY"))
+        return (await session.execute(stmt)).all()
+
+
+@router.get(
+    "/servers", response_model=list[ServerResponse], dependencies=[Depends(etag_for(Server))]
+)
+async def list_servers(db: ReadDB):
     """List all servers with knowledge bases."""
     result = await db.execute(
-        select(Server).order_by(Server.created_at.desc())
+        select(*_SERVER_COLUMNS).order_by(Server.created_at.desc())
     )
-    servers = result.scalars().all()
-    return [ServerResponse.model_validate(s) for s in servers]
+    return [ServerResponse.model_validate(row._mapping) for row in result]
 
 
 @router.post("/servers/{server_id}/channels")
@@ -49,18 +67,17 @@ async def set_monitored_channels(
     if not server:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Server not found")
 
-    updated = 0
-    for discord_id in body.channel_discord_ids:
-        result = await db.execute(
-            select(Channel).where(
-                Channel.server_id == server_id,
-                Channel.discord_id == discord_id,
-            )
+    result = await db.execute(
+        update(Channel)
+        .where(
+            Channel.server_id == server_id,
+            Channel.discord_id.in_(body.channel_discord_ids),
         )
-        channel = result.scalar_one_or_none()
-        if channel:
-            channel.is_monitored = body.is_monitored
-            updated += 1
+        .values(is_monitored=body.is_monitored)
+        .returning(Channel.id)
+    )
+    updated = len(result.all())
+    await db.commit()
 
     logger.info(
         "channels_updated",
@@ -72,12 +89,12 @@ async def set_monitored_channels(
 
 
 @router.get("/servers/{server_id}/stats", response_model=ServerStats)
-async def get_server_stats(server_id: int, db: DB):
+async def get_server_stats(server_id: int, db: ReadDB):
     """Get analytics for a server."""
     # Verify server
-    result = await db.execute(select(Server).where(Server.id == server_id))
-    server = result.scalar_one_or_none()
-    if not server:
+    result = await db.execute(select(Server.name).where(Server.id == server_id))
+    server_name = result.scalar_one_or_none()
+    if server_name is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Server not found")
 
     # Channel IDs for this server
@@ -88,60 +105,66 @@ async def get_server_stats(server_id: int, db: DB):
 
     if not channel_ids:
         return ServerStats(
-            server_id=server_id, server_name=server.name,
+            server_id=server_id, server_name=server_name,
             total_articles=0, total_threads=0, total_messages=0,
             noise_filtered=0, avg_quality_score=0.0,
             top_languages=[], top_tags=[],
         )
 
-    # Counts
-    msg_count = (await db.execute(
-        select(func.count()).where(Message.channel_id.in_(channel_ids))
-    )).scalar() or 0
-
-    thread_count = (await db.execute(
-        select(func.count()).where(Thread.channel_id.in_(channel_ids))
-    )).scalar() or 0
-
-    noise_count = (await db.execute(
-        select(func.count()).where(
-            Thread.channel_id.in_(channel_ids),
-            Thread.status == ThreadStatus.NOISE,
-        )
-    )).scalar() or 0
-
-    # Article stats
-    article_query = (
+    # Aggregations run in Postgres. The counts and the article average share one
+    # round trip (scalar subqueries next to the one-row article aggregate).
+    server_articles = (
         select(Article)
         .join(Thread, Thread.id == Article.thread_id)
         .where(Thread.channel_id.in_(channel_ids))
     )
-    articles = (await db.execute(article_query)).scalars().all()
-
-    total_articles = len(articles)
-    avg_quality = sum(a.quality_score for a in articles) / total_articles if total_articles else 0.0
-
-    # Top languages
-    lang_counts: dict[str, int] = {}
-    tag_counts: dict[str, int] = {}
-    for a in articles:
-        lang_counts[a.language] = lang_counts.get(a.language, 0) + 1
-        for t in a.tags:
-            tag_counts[t] = tag_counts.get(t, 0) + 1
+    article_stats = server_articles.with_only_columns(
+        func.count().label("total"), func.avg(Article.quality_score).label("avg_quality")
+    ).subquery()
+    summary_query = select(
+        select(func.count())
+        .where(Message.channel_id.in_(channel_ids))
+        .scalar_subquery(),
+        select(func.count())
+        .where(Thread.channel_id.in_(channel_ids))
+        .scalar_subquery(),
+        select(func.count())
+        .where(Thread.channel_id.in_(channel_ids), Thread.status == ThreadStatus.NOISE.value)
+        .scalar_subquery(),
+        article_stats.c.total,
+        article_stats.c.avg_quality,
+    )
+    msg_count, thread_count, noise_count, total_articles, avg_quality = (
+        (await db.execute(summary_query)).one()
+    )
+    # Hand the request's connection back to the pool before taking two more
+    await db.close()
+
+    lang_count = func.count().label("count")
+    language_query = (
+        server_articles.with_only_columns(Article.language, lang_count)
+        .group_by(Article.language)
+        .order_by(lang_count.desc())
+        .limit(10)
+    )
+    tags = server_articles.with_only_columns(func.unnest(Article.tags).label("tag")).subquery()
+    tag_count = func.count().label("count")
+    tag_query = (
+        select(tags.c.tag, tag_count).group_by(tags.c.tag).order_by(tag_count.desc()).limit(10)
+    )
 
-    top_languages = sorted(
-        [{"language": k, "count": v} for k, v in lang_counts.items()],
-        key=lambda x: x["count"], reverse=True,
-    )[:10]
+    # The two GROUP BY queries are the slow part; they run side by side
+    language_rows, tag_rows = await asyncio.gather(
+        _fetch_all(language_query), _fetch_all(tag_query)
+    )
+    avg_quality = avg_quality or 0.0
 
-    top_tags = sorted(
-        [{"tag": k, "count": v} for k, v in tag_counts.items()],
-        key=lambda x: x["count"], reverse=True,
-    )[:10]
+    top_languages = [{"language": lang, "count": count} for lang, count in language_rows]
+    top_tags = [{"tag": tag, "count": count} for tag, count in tag_rows]
 
     return ServerStats(
         server_id=server_id,
-        server_name=server.name,
+        server_name=server_name,
         total_articles=total_articles,
         total_threads=thread_count,
         total_messages=msg_count,
@@ -13,9 +13,10 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import time
+from functools import lru_cache
 
+import orjson
 import structlog
 from fastapi import APIRouter, HTTPException, Header, Request, status
 from sqlalchemy import select
@@ -37,14 +38,25 @@ PRICE_PLAN_MAP: dict[str, ServerPlan] = {
 }
 
 
+@lru_cache(maxsize=4)
+def _hmac_template(secret: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 with the pads already absorbed; copy() it per request."""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
 def _verify_stripe_signature(payload: bytes, sig_header: str, secret: str) -> dict:
     """Verify Stripe webhook signature (v1 scheme)."""
     if not sig_header:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing signature")
 
-    elements = dict(item.split("=", 1) for item in sig_header.split(",") if "=" in item)
-    timestamp = elements.get("t")
-    signature = elements.get("v1")
+    # "t=<ts>,v1=<sig>[,v0=...]": pick out the two fields in one pass
+    timestamp = signature = None
+    for part in sig_header.split(","):
+        key, _, value = part.partition("=")
+        if key == "t":
+            timestamp = value
+        elif key == "v1":
+            signature = value
 
     if not timestamp or not signature:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid signature format")
@@ -52,15 +64,15 @@ def _verify_stripe_signature(payload: bytes, sig_header: str, secret: str) -> di
     if abs(time.time() - int(timestamp)) > 300:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Timestamp too old")
 
-    signed_payload = f"{timestamp}.{payload.decode()}"
-    expected = hmac.new(
-        secret.encode(), signed_payload.encode(), hashlib.sha256
-    ).hexdigest()
+    # Signed payload is "<timestamp>.<raw body>"; hashed as bytes, no decode round-trip
+    mac = _hmac_template(secret).copy()
+    mac.update(timestamp.encode() + b"." + payload)
+    expected = mac.hexdigest()
 
     if not hmac.compare_digest(expected, signature):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid signature")
 
-    return json.loads(payload)
+    return orjson.loads(payload)
 
 
 async def _update_server_plan(db, discord_id: str, plan: ServerPlan):
@@ -72,8 +84,9 @@ async def _update_server_plan(db, discord_id: str, plan: ServerPlan):
     server = result.scalar_one_or_none()
     if server:
         old_plan = server.plan
-        server.plan = plan
-        logger.info("server_plan_updated", server=discord_id, old=old_plan.value, new=plan.value)
+        server.plan = plan.value
+        await db.commit()
+        logger.info("server_plan_updated", server=discord_id, old=old_plan, new=plan.value)
     else:
         logger.warning("stripe_server_not_found", discord_id=discord_id)
 
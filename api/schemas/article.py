@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import msgspec
 from pydantic import BaseModel, Field
 
 
@@ -46,6 +47,16 @@ class ArticleBrief(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ArticleModerateRequest(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=1000)
+    is_visible: bool
+
+
+class ArticleModerateResponse(BaseModel):
+    ids: list[int]
+    is_visible: bool
+
+
 class ArticleListResponse(BaseModel):
     items: list[ArticleBrief]
     total: int
@@ -53,6 +64,34 @@ class ArticleListResponse(BaseModel):
     page_size: int
 
 
+class ArticleBriefItem(msgspec.Struct):
+    """msgspec mirror of ArticleBrief for the article list's encode fast path.
+
+    Field order matches the list query's column order (required fields first),
+    so rows are passed positionally.
+    """
+
+    id: int
+    thread_summary: str
+    language: str
+    tags: list[str]
+    confidence: float
+    quality_score: float
+    created_at: datetime
+    article_type: str = "troubleshooting"
+    source_type: str = "discord"
+    framework: str | None = None
+
+
+class ArticleListPage(msgspec.Struct):
+    """msgspec mirror of ArticleListResponse."""
+
+    items: list[ArticleBriefItem]
+    total: int
+    page: int
+    page_size: int
+
+
 class SearchResult(BaseModel):
     """Search result with relevance score."""
 
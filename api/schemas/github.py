@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import msgspec
 from pydantic import BaseModel
 
 
@@ -27,6 +28,20 @@ class GitHubRepoResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class GitHubRepoItem(msgspec.Struct):
+    """msgspec mirror of GitHubRepoResponse for the list endpoint's encode fast path."""
+
+    id: int
+    external_id: str
+    name: str
+    source_type: str
+    plan: str
+    created_at: datetime
+    source_url: str | None = None
+    categories: list[dict] = []
+    last_fetched_at: str | None = None
+
+
 class GitHubSyncResponse(BaseModel):
     server_id: int
     status: str = "dispatched"
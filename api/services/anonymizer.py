@@ -16,18 +16,34 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from typing import NamedTuple
 
 import structlog
 
+try:  # optional: SIMD multi-pattern prefilter for batch ingest
+    import hyperscan
+except ImportError:  # pragma: no cover - depends on the platform
+    hyperscan = None
+
 logger = structlog.get_logger()
 
 
+class Redaction(NamedTuple):
+    """One redacted span; offsets refer to the original text."""
+
+    type: str
+    original: str
+    replacement: str
+    start: int
+    end: int
+
+
 @dataclass
 class AnonymizationResult:
     """Result of anonymizing a text."""
 
     text: str
-    redactions: list[dict] = field(default_factory=list)
+    redactions: list[Redaction] = field(default_factory=list)
 
     @property
     def redaction_count(self) -> int:
@@ -97,6 +113,87 @@ _PATTERNS: list[tuple[str, re.Pattern, str]] = [
 ]
 
 
+def _build_prefilter():
+    """Compile every pattern into one Hyperscan database, or None without hyperscan.
+
+    Hyperscan has no lookaround, so the patterns are compiled in prefilter mode:
+    a hit means the text *may* contain PII and goes through the regex path; no
+    hit means it certainly doesn't. UTF8|UCP keeps \\b and \\d Unicode-aware like re.
+    """
+    if hyperscan is None:
+        return None
+    flags = (
+        hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+    )
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        db.compile(
+            expressions=[pattern.pattern.encode() for _, pattern, _ in _PATTERNS],
+            ids=list(range(len(_PATTERNS))),
+            flags=[flags] * len(_PATTERNS),
+        )
+    except hyperscan.error as e:
+        logger.warning("pii_prefilter_unavailable", error=str(e))
+        return None
+    return db
+
+
+_PREFILTER = _build_prefilter()
+
+
+def _may_contain_pii(text: str) -> bool:
+    """Cheap Hyperscan pass; True when the regex path has to run."""
+    if _PREFILTER is None:
+        return True
+    try:
+        data = text.encode()
+    except UnicodeEncodeError:  # lone surrogates: let re handle it
+        return True
+
+    hits: list[int] = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.append(pattern_id)
+        return True  # any hit is enough; stop scanning
+
+    try:
+        _PREFILTER.scan(data, match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return bool(hits)
+
+
+def _blank_out(text: str, spans: list[tuple[int, int]]) -> str:
+    """Replace each (start, end) span with NULs, keeping every offset intact.
+
+    NUL is a non-word character that no pattern after URL_AUTH can match, so it
+    acts like a replacement token for ``\\b`` and the lookarounds.
+    """
+    parts: list[str] = []
+    pos = 0
+    for start, end in spans:
+        parts.append(text[pos:start])
+        parts.append("\0" * (end - start))
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def _splice(text: str, redactions: list[Redaction]) -> str:
+    """Build the redacted text in one pass from non-overlapping, sorted redactions."""
+    parts: list[str] = []
+    pos = 0
+    for r in redactions:
+        parts.append(text[pos:r.start])
+        parts.append(r.replacement)
+        pos = r.end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
 def anonymize(text: str) -> AnonymizationResult:
     """Redact PII from text using regex patterns.
 
@@ -106,45 +203,52 @@ def anonymize(text: str) -> AnonymizationResult:
     Returns:
         AnonymizationResult with redacted text and list of redactions.
     """
-    redactions: list[dict] = []
-    result = text
+    redactions: list[Redaction] = []
+    # Patterns run in registry order over ``scan``, a copy of the text in which
+    # every span already claimed by an earlier pattern is blanked out, so a
+    # lower-priority pattern can neither take over nor straddle a redacted span.
+    scan = text
 
     for pii_type, pattern, replacement in _PATTERNS:
-        matches = list(pattern.finditer(result))
-        if not matches:
-            continue
-
-        # Process matches in reverse order to preserve positions
-        for match in reversed(matches):
-            original = match.group()
+        claimed: list[tuple[int, int]] = []
+        for match in pattern.finditer(scan):
+            start, end = match.span()
+            original = text[start:end]
 
             # Skip very short matches for phone (false positives)
             if pii_type == "PHONE" and len(original.replace(" ", "").replace("-", "")) < 7:
                 continue
 
             # Skip localhost IPs (not PII)
-            if pii_type == "IPV4" and original.startswith("127.") or original == "0.0.0.0":
+            if pii_type == "IPV4" and (original.startswith("127.") or original == "0.0.0.0"):
                 continue
 
-            redactions.append({
-                "type": pii_type,
-                "original": original,
-                "replacement": replacement,
-                "start": match.start(),
-                "end": match.end(),
-            })
-            result = result[:match.start()] + replacement + result[match.end():]
+            redactions.append(Redaction(pii_type, original, replacement, start, end))
+            claimed.append((start, end))
+
+        if claimed:
+            scan = _blank_out(scan, claimed)
+
+    redactions.sort(key=lambda r: r.start)
+    result = _splice(text, redactions)
 
     if redactions:
         logger.debug(
             "pii_redacted",
             count=len(redactions),
-            types=[r["type"] for r in redactions],
+            types=[r.type for r in redactions],
         )
 
     return AnonymizationResult(text=result, redactions=redactions)
 
 
 def anonymize_batch(texts: list[str]) -> list[AnonymizationResult]:
-    """Anonymize a batch of texts."""
-    return [anonymize(t) for t in texts]
+    """Anonymize a batch of texts.
+
+    With hyperscan installed, texts that match none of the patterns skip the
+    regex pass entirely.
+    """
+    return [
+        anonymize(t) if _may_contain_pii(t) else AnonymizationResult(text=t)
+        for t in texts
+    ]
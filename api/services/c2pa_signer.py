@@ -10,18 +10,33 @@ In development, uses a self-signed certificate.
 from __future__ import annotations
 
 import hashlib
-import json
+from collections.abc import Iterable
+from os import PathLike
 
+import orjson
 import structlog
 
 logger = structlog.get_logger()
 
 
-def compute_content_hash(data: str | bytes) -> str:
-    """Compute SHA-256 hash of content."""
+def compute_content_hash(data: str | bytes | Iterable[bytes]) -> str:
+    """Compute SHA-256 hash of content, given whole or as an iterable of chunks."""
     if isinstance(data, str):
         data = data.encode()
-    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+    if isinstance(data, bytes):
+        return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+    digest = hashlib.sha256()
+    for chunk in data:
+        digest.update(chunk)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def compute_file_hash(path: str | PathLike) -> str:
+    """Compute SHA-256 hash of a file, streamed from disk."""
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256")
+    return f"sha256:{digest.hexdigest()}"
 
 
 def create_manifest(
@@ -88,6 +103,6 @@ def sign_manifest(manifest: dict) -> str:
     In production, this would use AWS KMS to sign with an X.509 certificate.
     For now, returns the SHA-256 of the manifest JSON.
     """
-    manifest_json = json.dumps(manifest, sort_keys=True)
+    manifest_json = orjson.dumps(manifest, option=orjson.OPT_SORT_KEYS)
     manifest_hash = compute_content_hash(manifest_json)
     return manifest_hash
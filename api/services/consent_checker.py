@@ -4,21 +4,56 @@ Queries the consent_records table and removes messages from users
 who have not consented (or revoked consent) before pipeline processing.
 
 This is a GDPR requirement: no data processing without explicit consent.
+
+Consent sets are cached per worker process for CONSENT_CACHE_TTL seconds,
+tagged with the Redis consent version. Every consent change bumps that
+version, so a cached set is never used after a grant or revocation. If Redis
+is unreachable the cache is bypassed and the database is always queried.
 """
 
 from __future__ import annotations
 
+import redis
 import structlog
+from cachetools import TTLCache
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session
 
 from api.config import settings
+from api.models.consent import CONSENT_VERSION_KEY
 
 logger = structlog.get_logger()
 
-# Sync engine for Celery workers (no async event loop)
-_sync_url = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql+psycopg2://")
-_engine = create_engine(_sync_url, pool_pre_ping=True, pool_size=5)
+# Sync engine for Celery workers (no async event loop). psycopg 3 with
+# prepare_threshold=1 turns the consent query into a server-side prepared
+# statement from its second execution on each connection.
+_sync_url = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql+psycopg://")
+_engine = create_engine(
+    _sync_url,
+    pool_pre_ping=True,
+    pool_size=settings.WORKER_DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    connect_args={"prepare_threshold": 1},
+)
+
+CONSENT_CACHE_TTL = 60  # seconds
+_redis = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+# server_id -> (consent version, consented user hashes)
+_consent_cache: TTLCache[str, tuple[bytes | None, set[str]]] = TTLCache(
+    maxsize=1024, ttl=CONSENT_CACHE_TTL
+)
+_NO_VERSION = object()
+
+
+def _consent_version() -> bytes | None | object:
+    """Current consent version from Redis, or _NO_VERSION if it can't be read."""
+    try:
+        return _redis.get(CONSENT_VERSION_KEY)
+    except redis.RedisError as e:
+        logger.warning("consent_version_unavailable", error=str(e))
+        return _NO_VERSION
 
 
 def get_consented_users(server_id: str) -> set[str]:
@@ -30,6 +65,12 @@ def get_consented_users(server_id: str) -> set[str]:
     Returns:
         Set of user_hash strings with active consent.
     """
+    version = _consent_version()
+    if version is not _NO_VERSION:
+        cached = _consent_cache.get(server_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
     try:
         with Session(_engine) as db:
             rows = db.execute(
@@ -43,12 +84,16 @@ def get_consented_users(server_id: str) -> set[str]:
                 """),
                 {"server_id": server_id},
             ).fetchall()
-        return {row[0] for row in rows}
     except Exception as e:
         logger.error("consent_check_failed", error=str(e))
         # On DB error, return empty set (fail-safe: no processing without consent)
         return set()
 
+    users = {row[0] for row in rows}
+    if version is not _NO_VERSION:
+        _consent_cache[server_id] = (version, users)
+    return users
+
 
 def filter_consented_messages(
     messages: list[dict],
@@ -77,15 +122,8 @@ def filter_consented_messages(
         )
         return [], len(messages)
 
-    filtered = []
-    excluded = 0
-
-    for msg in messages:
-        author_hash = msg.get("author_hash", "")
-        if author_hash in consented_users:
-            filtered.append(msg)
-        else:
-            excluded += 1
+    filtered = [msg for msg in messages if msg.get("author_hash", "") in consented_users]
+    excluded = len(messages) - len(filtered)
 
     if excluded > 0:
         logger.info(
@@ -0,0 +1,292 @@
+"""LMDB-backed LangGraph checkpointer for single-host deployments.
+
+Persistent like MongoDBSaver, but checkpoint reads/writes are local
+memory-mapped B-tree operations instead of a network round trip. LMDB's
+lock file makes one environment safe to share between the Celery worker
+processes of a host; clustered deployments keep MongoDB.
+
+Storage layout mirrors InMemorySaver, in three LMDB sub-databases:
+  checkpoints  thread\\0ns\\0checkpoint_id          -> (checkpoint, metadata, parent_id)
+  writes       thread\\0ns\\0checkpoint_id\\0task\\0idx -> (task_id, channel, value, task_path)
+  blobs        thread\\0ns\\0channel\\0version         -> value
+Values are serialized by the saver's serde and the records packed with
+ormsgpack. Checkpoint IDs are time-ordered, so the last key under a
+thread/ns prefix is the latest checkpoint.
+
+Needs the `checkpoint-lmdb` extra.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import AsyncIterator, Iterator, Sequence
+from functools import cache
+from typing import Any
+
+import lmdb
+import ormsgpack
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+SEP = "\0"
+MAP_SIZE = 2**32  # 4 GiB of address space; the file only grows as data is written
+
+
+def _key(*parts: str) -> bytes:
+    return SEP.join(parts).encode()
+
+
+def _pack(*values) -> bytes:
+    return ormsgpack.packb(values)
+
+
+def _prefix_items(txn: lmdb.Transaction, db, prefix: bytes) -> Iterator[tuple[bytes, bytes]]:
+    cursor = txn.cursor(db)
+    if cursor.set_range(prefix):
+        for key, value in cursor:
+            if not key.startswith(prefix):
+                break
+            yield key, value
+
+
+class LMDBSaver(BaseCheckpointSaver[str]):
+    """Checkpoint saver storing graph state in a local LMDB environment."""
+
+    def __init__(self, path: str, *, map_size: int = MAP_SIZE, serde=None) -> None:
+        super().__init__(serde=serde)
+        os.makedirs(path, exist_ok=True)
+        self.env = lmdb.open(path, map_size=map_size, max_dbs=3)
+        self._checkpoints = self.env.open_db(b"checkpoints")
+        self._writes = self.env.open_db(b"writes")
+        self._blobs = self.env.open_db(b"blobs")
+
+    # Same "<counter>.<random>" string versions as InMemorySaver
+    get_next_version = InMemorySaver.get_next_version
+
+    def _tuple(
+        self, txn: lmdb.Transaction, thread_id: str, ns: str, checkpoint_id: str, record: bytes,
+    ) -> CheckpointTuple:
+        checkpoint_t, metadata_t, parent_id = ormsgpack.unpackb(record)
+        checkpoint: Checkpoint = self.serde.loads_typed(tuple(checkpoint_t))
+
+        channel_values = {}
+        for channel, version in checkpoint["channel_versions"].items():
+            blob = txn.get(_key(thread_id, ns, channel, str(version)), db=self._blobs)
+            if blob is not None:
+                type_, data = ormsgpack.unpackb(blob)
+                if type_ != "empty":
+                    channel_values[channel] = self.serde.loads_typed((type_, data))
+
+        pending_writes = []
+        for _, value in _prefix_items(
+            txn, self._writes, _key(thread_id, ns, checkpoint_id, "")
+        ):
+            task_id, channel, type_, data, _ = ormsgpack.unpackb(value)
+            pending_writes.append((task_id, channel, self.serde.loads_typed((type_, data))))
+
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            metadata=self.serde.loads_typed(tuple(metadata_t)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=pending_writes,
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        thread_id = config["configurable"]["thread_id"]
+        ns = config["configurable"].get("checkpoint_ns", "")
+        with self.env.begin() as txn:
+            if checkpoint_id := get_checkpoint_id(config):
+                record = txn.get(_key(thread_id, ns, checkpoint_id), db=self._checkpoints)
+                if record is None:
+                    return None
+            else:
+                # Latest checkpoint: the last key under the thread/ns prefix
+                latest = None
+                for key, record in _prefix_items(txn, self._checkpoints, _key(thread_id, ns, "")):
+                    latest = key, record
+                if latest is None:
+                    return None
+                checkpoint_id = latest[0].decode().rsplit(SEP, 1)[1]
+                record = latest[1]
+            return self._tuple(txn, thread_id, ns, checkpoint_id, record)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        prefix = b""
+        config_id = None
+        if config:
+            configurable = config["configurable"]
+            prefix = _key(configurable["thread_id"], "")
+            if (ns := configurable.get("checkpoint_ns")) is not None:
+                prefix = _key(configurable["thread_id"], ns, "")
+            config_id = get_checkpoint_id(config)
+        before_id = get_checkpoint_id(before) if before else None
+
+        with self.env.begin() as txn:
+            entries = [
+                (key.decode().split(SEP), record)
+                for key, record in _prefix_items(txn, self._checkpoints, prefix)
+            ]
+            # Newest first, like InMemorySaver
+            entries.sort(key=lambda entry: entry[0][2], reverse=True)
+            for (thread_id, ns, checkpoint_id), record in entries:
+                if config_id and checkpoint_id != config_id:
+                    continue
+                if before_id and checkpoint_id >= before_id:
+                    continue
+                if filter:
+                    metadata = self.serde.loads_typed(tuple(ormsgpack.unpackb(record)[1]))
+                    if not all(metadata.get(k) == v for k, v in filter.items()):
+                        continue
+                if limit is not None:
+                    if limit <= 0:
+                        break
+                    limit -= 1
+                yield self._tuple(txn, thread_id, ns, checkpoint_id, record)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        ns = config["configurable"]["checkpoint_ns"]
+        checkpoint = checkpoint.copy()
+        values = checkpoint.pop("channel_values")
+
+        with self.env.begin(write=True) as txn:
+            for channel, version in new_versions.items():
+                blob = (
+                    self.serde.dumps_typed(values[channel]) if channel in values else ("empty", b"")
+                )
+                txn.put(_key(thread_id, ns, channel, str(version)), _pack(*blob), db=self._blobs)
+            txn.put(
+                _key(thread_id, ns, checkpoint["id"]),
+                _pack(
+                    self.serde.dumps_typed(checkpoint),
+                    self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
+                    config["configurable"].get("checkpoint_id"),  # parent
+                ),
+                db=self._checkpoints,
+            )
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+
+        with self.env.begin(write=True) as txn:
+            for idx, (channel, value) in enumerate(writes):
+                write_idx = WRITES_IDX_MAP.get(channel, idx)
+                # Offset keeps the special (negative) indexes sortable as text
+                key = _key(thread_id, ns, checkpoint_id, task_id, f"{write_idx + 1000:06d}")
+                type_, data = self.serde.dumps_typed(value)
+                # Regular writes are kept once stored; special ones are replaced
+                txn.put(
+                    key,
+                    _pack(task_id, channel, type_, data, task_path),
+                    overwrite=write_idx < 0,
+                    db=self._writes,
+                )
+
+    def delete_thread(self, thread_id: str) -> None:
+        prefix = _key(thread_id, "")
+        with self.env.begin(write=True) as txn:
+            for db in (self._checkpoints, self._writes, self._blobs):
+                for key in [key for key, _ in _prefix_items(txn, db, prefix)]:
+                    txn.delete(key, db=db)
+
+    # Local memory-mapped operations take microseconds: call them directly
+    # instead of hopping to a thread, as InMemorySaver does
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return self.get_tuple(config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        self.delete_thread(thread_id)
+
+
+@cache
+def get_lmdb_saver(path: str, pid: int) -> LMDBSaver:
+    """One saver per path and process: an LMDB environment must not be opened
+    twice in a process, nor used across fork. Pass os.getpid().
+    """
+    return LMDBSaver(path)
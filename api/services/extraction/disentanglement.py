@@ -6,12 +6,13 @@ clustering to group related messages into coherent threads.
 
 Algorithm:
 1. Generate 384-dim embeddings for all messages (all-MiniLM-L6-v2)
-2. Compute pairwise cosine similarity matrix
-3. Build adjacency graph using:
+2. Sweep messages in time order; compare each only against the messages
+   inside its temporal window (no full n×n similarity matrix)
+3. Build a sparse adjacency graph using:
    - Semantic similarity > threshold (0.75)
    - Temporal proximity (within 4-hour window)
    - Explicit links: reply_to references, @mentions
-4. Find connected components via BFS → each component = one thread
+4. Find connected components (scipy.sparse.csgraph) → each component = one thread
 5. Sort messages within each thread by timestamp
 """
 
@@ -21,7 +22,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 
 from api.services.embeddings import encode_batch
 
@@ -68,87 +70,87 @@ class DisentanglementEngine:
         texts = [m.content for m in messages]
         embeddings = encode_batch(texts)
 
-        # Step 2: Compute pairwise cosine similarity matrix
-        sim_matrix = cosine_similarity(embeddings)
+        # Steps 2-3: Sparse adjacency graph from windowed similarity + explicit links
+        adjacency = self._build_adjacency(messages, embeddings)
 
-        # Step 3: Build adjacency graph
-        n = len(messages)
-        adjacency = np.zeros((n, n), dtype=bool)
-
-        for i in range(n):
-            for j in range(i + 1, n):
-                if self._should_link(messages, sim_matrix, i, j):
-                    adjacency[i][j] = True
-                    adjacency[j][i] = True
+        # Step 4: Find connected components; labels follow first-occurrence order
+        n_components, labels = connected_components(adjacency, directed=False)
+        groups: list[list[int]] = [[] for _ in range(n_components)]
+        for idx, label in enumerate(labels):
+            groups[label].append(idx)
 
-        # Step 4: Find connected components via BFS
-        visited: set[int] = set()
         threads: list[list[RawMessage]] = []
-
-        for start in range(n):
-            if start in visited:
-                continue
-
-            queue = [start]
-            component: list[int] = []
-
-            while queue:
-                node = queue.pop(0)
-                if node in visited:
-                    continue
-                visited.add(node)
-                component.append(node)
-
-                for neighbor in range(n):
-                    if adjacency[node][neighbor] and neighbor not in visited:
-                        queue.append(neighbor)
-
+        for component in groups:
             # Sort by timestamp within thread
             component.sort(key=lambda idx: messages[idx].timestamp)
             threads.append([messages[idx] for idx in component])
 
         return threads
 
-    def _should_link(
-        self,
-        messages: list[RawMessage],
-        sim_matrix: np.ndarray,
-        i: int,
-        j: int,
-    ) -> bool:
-        """Determine if two messages should be in the same thread."""
-        msg_i = messages[i]
-        msg_j = messages[j]
-
-        # Temporal gate: messages must be within the time window
-        time_delta = abs(msg_i.timestamp - msg_j.timestamp)
-        if time_delta > self.TEMPORAL_WINDOW:
-            return False
-
-        # Explicit link: reply_to
-        if msg_j.reply_to and msg_j.reply_to == msg_i.id:
-            return True
-        if msg_i.reply_to and msg_i.reply_to == msg_j.id:
-            return True
-
-        # Explicit link: @mention of the other author
-        if msg_i.author_hash in msg_j.mentions:
-            return True
-        if msg_j.author_hash in msg_i.mentions:
-            return True
-
-        # Compute effective similarity with boosts
-        similarity = float(sim_matrix[i][j])
-
-        # Boost: same author within 60 seconds (likely continuation)
-        if (
-            msg_i.author_hash == msg_j.author_hash
-            and time_delta <= self.SAME_AUTHOR_WINDOW
-        ):
-            similarity += self.SAME_AUTHOR_BOOST
-
-        # Boost: both messages contain code blocks (likely same tech discussion)
-        if msg_i.has_code and msg_j.has_code:
-            similarity += self.ERROR_CODE_BOOST
-
-        return similarity >= self.SIMILARITY_THRESHOLD
+    def _build_adjacency(self, messages: list[RawMessage], embeddings: np.ndarray) -> coo_matrix:
+        """Sparse n×n graph of which message pairs belong in the same thread.
+
+        Only pairs within TEMPORAL_WINDOW can link, so messages are sorted by time
+        and each is compared only against the messages ahead of it in the window.
+        Memory stays linear in n plus the number of edges.
+        """
+        n = len(messages)
+        ts = np.array([m.timestamp.timestamp() for m in messages])
+        order = np.argsort(ts, kind="stable")
+        sorted_ts = ts[order]
+        # encode_batch returns unit vectors, so a dot product is the cosine similarity.
+        # They come as float16; NumPy only has BLAS matmul for float32/64.
+        unit = embeddings.astype(np.float32)
+        _, author_ids = np.unique([m.author_hash for m in messages], return_inverse=True)
+        code = np.array([m.has_code for m in messages], dtype=bool)
+
+        window = self.TEMPORAL_WINDOW.total_seconds()
+        same_author_window = self.SAME_AUTHOR_WINDOW.total_seconds()
+        rows: list[np.ndarray] = []
+        cols: list[np.ndarray] = []
+
+        # Window end (exclusive) for every position, found by binary search; only
+        # positions with at least one later message inside the window are visited
+        window_end = np.searchsorted(sorted_ts, sorted_ts + window, side="right")
+        for pos in np.flatnonzero(window_end - np.arange(n) > 1):
+            end = window_end[pos]
+            i = order[pos]
+            others = order[pos + 1:end]
+            similarity = unit[others] @ unit[i]
+
+            # Boost: same author within the window (likely continuation)
+            time_delta = sorted_ts[pos + 1:end] - sorted_ts[pos]
+            similarity += self.SAME_AUTHOR_BOOST * (
+                (author_ids[others] == author_ids[i]) & (time_delta <= same_author_window)
+            )
+            # Boost: both messages contain code blocks (likely same tech discussion)
+            if code[i]:
+                similarity += self.ERROR_CODE_BOOST * code[others]
+
+            linked = others[similarity >= self.SIMILARITY_THRESHOLD]
+            rows.append(np.full(len(linked), i))
+            cols.append(linked)
+
+        # Explicit links: reply_to references and @mentions of the other author,
+        # still subject to the temporal gate
+        index_by_id = {m.id: i for i, m in enumerate(messages)}
+        indices_by_author: dict[str, list[int]] = {}
+        for i, m in enumerate(messages):
+            indices_by_author.setdefault(m.author_hash, []).append(i)
+
+        explicit: list[tuple[int, int]] = []
+        for j, m in enumerate(messages):
+            if m.reply_to and (i := index_by_id.get(m.reply_to)) is not None:
+                explicit.append((i, j))
+            for author in m.mentions:
+                explicit.extend((i, j) for i in indices_by_author.get(author, ()))
+        explicit = [(i, j) for i, j in explicit if i != j and abs(ts[i] - ts[j]) <= window]
+        if explicit:
+            pairs = np.array(explicit)
+            rows.append(pairs[:, 0])
+            cols.append(pairs[:, 1])
+
+        row = np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+        col = np.concatenate(cols) if cols else np.empty(0, dtype=np.intp)
+        # Edges are stored one way; connected_components treats them as undirected
+        return coo_matrix((np.ones(len(row), dtype=bool), (row, col)), shape=(n, n))
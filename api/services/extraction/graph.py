@@ -8,34 +8,70 @@ Graph topology:
 Usage:
   graph = build_graph(use_mongodb=False)
   result = graph.invoke(initial_state, config={"configurable": {"thread_id": "ch_123"}})
+
+  # Every disentangled thread, LLM calls issued concurrently:
+  results = asyncio.run(extract_all_threads(graph, initial_state, thread_id="ch_123"))
+
+  # Any other bulk work: run_batch(graph, states, configs) rather than a loop of invoke()
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+from functools import cache
+from typing import TYPE_CHECKING
 
 import structlog
+from langchain_core.runnables import RunnableLambda
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 
-from api.services.extraction.disentanglement import DisentanglementEngine
-from api.services.extraction.nodes.compiler import compiler_node
-from api.services.extraction.nodes.evaluator import evaluator_node, route_after_evaluation
+from api.services.extraction.nodes.batch_extract import batch_extract_node
+from api.services.extraction.nodes.compiler import acompiler_node, compiler_node
+from api.services.extraction.nodes.evaluator import (
+    aevaluator_node,
+    evaluator_node,
+    route_after_evaluation,
+)
 from api.services.extraction.nodes.quality_gate import quality_gate_node, route_after_quality
-from api.services.extraction.nodes.router import route_after_classification, router_node
-from api.services.extraction.state import AgentState
+from api.services.extraction.nodes.router import (
+    aclassify_threads,
+    arouter_node,
+    route_after_classification,
+    router_node,
+)
+from api.services.extraction.state import AgentState, ThreadMessage
+
+if TYPE_CHECKING:
+    from api.services.extraction.disentanglement import DisentanglementEngine, RawMessage
 
 logger = structlog.get_logger()
 
-# Shared disentanglement engine (loads Sentence-BERT once)
-_disentangle_engine: DisentanglementEngine | None = None
+# Graph runs in flight at once per process. Each run makes one LLM call at a
+# time, so this also caps concurrent Anthropic requests (org RPM limits).
+EXTRACTION_CONCURRENCY = int(os.environ.get("EXTRACTION_CONCURRENCY", "8"))
 
 
+@cache
 def _get_disentangle_engine() -> DisentanglementEngine:
-    global _disentangle_engine
-    if _disentangle_engine is None:
-        _disentangle_engine = DisentanglementEngine()
-    return _disentangle_engine
+    """Shared disentanglement engine (loads Sentence-BERT once)."""
+    # Deferred: pulls in torch + sentence-transformers, which pre-threaded
+    # sources (skip_disentangle) never need
+    from api.services.extraction.disentanglement import DisentanglementEngine
+
+    return DisentanglementEngine()
+
+
+def _thread_message(msg: RawMessage, timestamp: str) -> ThreadMessage:
+    return {
+        "author_hash": msg.author_hash,
+        "content": msg.content,
+        "timestamp": timestamp,
+        "has_code": msg.has_code,
+        "has_mention": bool(msg.mentions),
+        "reply_to": msg.reply_to,
+    }
 
 
 def disentangle_node(state: AgentState) -> dict:
@@ -47,6 +83,10 @@ def disentangle_node(state: AgentState) -> dict:
     from api.services.extraction.disentanglement import RawMessage
     from datetime import datetime
 
+    # Threads already supplied by the caller (per-thread runs from extract_all_threads)
+    if state.get("threads"):
+        return {"current_thread_idx": 0}
+
     # Skip clustering for pre-threaded sources (GitHub Discussions)
     if state.get("skip_disentangle"):
         thread_msgs = []
@@ -64,50 +104,41 @@ def disentangle_node(state: AgentState) -> dict:
     engine = _get_disentangle_engine()
 
     raw_messages = []
+    # id(RawMessage) -> the caller's ISO string, emitted as-is instead of
+    # re-serializing the datetime the engine needs for ordering
+    iso_timestamps: dict[int, str] = {}
     for m in state["messages"]:
-        raw_messages.append(RawMessage(
+        ts = m.get("timestamp", datetime.now())
+        raw = RawMessage(
             id=m.get("id", ""),
             author_hash=m.get("author_hash", ""),
             content=m.get("content", ""),
-            timestamp=datetime.fromisoformat(m["timestamp"]) if isinstance(m.get("timestamp"), str) else m.get("timestamp", datetime.now()),
+            timestamp=datetime.fromisoformat(ts) if isinstance(ts, str) else ts,
             has_code="```" in m.get("content", ""),
             reply_to=m.get("reply_to"),
             mentions=m.get("mentions", []),
-        ))
+        )
+        if isinstance(ts, str):
+            iso_timestamps[id(raw)] = ts
+        raw_messages.append(raw)
 
     threads = engine.cluster(raw_messages)
 
-    # Convert back to ThreadMessage dicts
-    thread_dicts = []
-    for thread in threads:
-        thread_msgs = []
-        for msg in thread:
-            thread_msgs.append({
-                "author_hash": msg.author_hash,
-                "content": msg.content,
-                "timestamp": msg.timestamp.isoformat(),
-                "has_code": msg.has_code,
-                "has_mention": bool(msg.mentions),
-                "reply_to": msg.reply_to,
-            })
-        thread_dicts.append(thread_msgs)
+    # Convert back to ThreadMessage dicts, once
+    all_dicts = [
+        [
+            _thread_message(msg, iso_timestamps.get(id(msg)) or msg.timestamp.isoformat())
+            for msg in thread
+        ]
+        for thread in threads
+    ]
 
     # Filter out empty/single-message threads and pick the largest
-    thread_dicts = [t for t in thread_dicts if len(t) >= 2]
+    thread_dicts = [t for t in all_dicts if len(t) >= 2]
 
     if not thread_dicts:
         # If no multi-message threads, use all messages as one thread
-        all_msgs = []
-        for thread in threads:
-            for msg in thread:
-                all_msgs.append({
-                    "author_hash": msg.author_hash,
-                    "content": msg.content,
-                    "timestamp": msg.timestamp.isoformat(),
-                    "has_code": msg.has_code,
-                    "has_mention": bool(msg.mentions),
-                    "reply_to": msg.reply_to,
-                })
+        all_msgs = [msg for thread in all_dicts for msg in thread]
         thread_dicts = [all_msgs] if all_msgs else []
 
     # Sort by size — process largest thread first
@@ -119,12 +150,15 @@ def disentangle_node(state: AgentState) -> dict:
     }
 
 
-def build_graph(use_mongodb: bool = False):
+def build_graph(use_mongodb: bool = False, use_batch_api: bool = False):
     """Construct and compile the extraction pipeline graph.
 
     Args:
         use_mongodb: If True, use MongoDBSaver for persistent checkpoints.
                      If False, use MemorySaver (dev/testing).
+        use_batch_api: If True, build the offline topology: every thread goes
+                     through the Anthropic Message Batches API in a single
+                     batch_extract node, results in state["thread_results"].
 
     Returns:
         Compiled LangGraph app ready for .invoke() or .stream().
@@ -132,11 +166,21 @@ def build_graph(use_mongodb: bool = False):
     # 1. Initialize StateGraph with schema
     workflow = StateGraph(AgentState)
 
+    if use_batch_api:
+        workflow.add_node("disentangle", disentangle_node)
+        workflow.add_node("batch_extract", batch_extract_node)
+        workflow.set_entry_point("disentangle")
+        workflow.add_edge("disentangle", "batch_extract")
+        workflow.add_edge("batch_extract", END)
+        return _compile(workflow, use_mongodb)
+
     # 2. Add nodes
     workflow.add_node("disentangle", disentangle_node)
-    workflow.add_node("router", router_node)
-    workflow.add_node("evaluator", evaluator_node)
-    workflow.add_node("compiler", compiler_node)
+    workflow.add_node("router", RunnableLambda(router_node, afunc=arouter_node))
+    # LLM nodes with an async twin: ainvoke/abatch await the Anthropic call
+    # instead of parking a thread on it
+    workflow.add_node("evaluator", RunnableLambda(evaluator_node, afunc=aevaluator_node))
+    workflow.add_node("compiler", RunnableLambda(compiler_node, afunc=acompiler_node))
     workflow.add_node("quality_gate", quality_gate_node)
 
     # 3. Set entry point
@@ -163,8 +207,18 @@ def build_graph(use_mongodb: bool = False):
         {"compiler": "compiler", "__end__": END},
     )
 
-    # 6. Select checkpointer
-    if use_mongodb:
+    return _compile(workflow, use_mongodb)
+
+
+def _compile(workflow: StateGraph, use_mongodb: bool):
+    # Select checkpointer: persistent runs use MongoDB, or a local LMDB file
+    # on single-host deployments (CHECKPOINT_BACKEND=lmdb)
+    if use_mongodb and os.environ.get("CHECKPOINT_BACKEND") == "lmdb":
+        from api.services.extraction.checkpoint import get_lmdb_saver
+
+        path = os.environ.get("CHECKPOINT_LMDB_PATH", "/var/lib/neuroweave/ckpt")
+        checkpointer = get_lmdb_saver(path, os.getpid())
+    elif use_mongodb:
         from langgraph.checkpoint.mongodb import MongoDBSaver
         from pymongo import MongoClient
 
@@ -172,13 +226,57 @@ def build_graph(use_mongodb: bool = False):
         checkpointer = MongoDBSaver(
             client=mongo_client,
             db_name="neuroweave",
-            collection_name="checkpoints",
+            checkpoint_collection_name="checkpoints",
         )
     else:
         checkpointer = MemorySaver()
 
-    # 7. Compile
     app = workflow.compile(checkpointer=checkpointer)
 
     logger.info("graph_compiled", checkpointer=type(checkpointer).__name__)
     return app
+
+
+async def run_batch(
+    graph, states: list[AgentState], configs: list[dict], concurrency: int = EXTRACTION_CONCURRENCY,
+) -> list[dict | Exception]:
+    """Run many inputs through the graph concurrently; the entry point for bulk work.
+
+    LangGraph keeps at most `concurrency` runs in flight, starting the next as
+    soon as one finishes. Each input needs its own config (checkpoint thread_id).
+    A failed run comes back as its exception in place of the final state, so one
+    bad thread doesn't throw away the others.
+    """
+    configs = [{**config, "max_concurrency": concurrency} for config in configs]
+    return await graph.abatch(states, configs, return_exceptions=True)
+
+
+async def extract_all_threads(
+    graph, initial_state: AgentState, thread_id: str,
+) -> list[dict | Exception]:
+    """Disentangle once, then run every thread through the graph concurrently.
+
+    The threads are classified in batched router calls first, so the per-thread
+    router nodes only fall back to an LLM call for threads left unclassified.
+    Each thread runs under its own checkpoint thread ("{thread_id}_{n}").
+    Returns the final state of every thread run, or the exception it failed
+    with, in disentanglement order (largest thread first).
+    """
+    threads = (await asyncio.to_thread(disentangle_node, initial_state))["threads"]
+
+    states = [{**initial_state, "threads": [thread], "current_thread_idx": 0} for thread in threads]
+    if len(threads) > 1:
+        routed = await aclassify_threads(threads, concurrency=EXTRACTION_CONCURRENCY)
+        for state, classification in zip(states, routed):
+            if classification is not None:
+                state.update(classification)
+    configs = [{"configurable": {"thread_id": f"{thread_id}_{n}"}} for n in range(len(states))]
+    results = await run_batch(graph, states, configs)
+
+    logger.info(
+        "threads_extracted",
+        threads=len(results),
+        failed=sum(isinstance(r, Exception) for r in results),
+        concurrency=EXTRACTION_CONCURRENCY,
+    )
+    return results
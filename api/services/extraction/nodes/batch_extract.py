@@ -0,0 +1,220 @@
+"""Batch Extract Node — router, evaluator and compiler for every thread at once.
+
+Offline counterpart of the per-thread LLM nodes, for backfills and bulk ingest.
+Requests go through the Anthropic Message Batches API: half the price of
+interactive calls, with results usually within minutes (at most 24h).
+
+Two batch rounds over all threads:
+  1. classify + evaluate (the evaluator prompt does not depend on the article type)
+  2. compile the threads that route_after_evaluation sends to the compiler
+Compiled articles are then scored by the quality gate. There are no compile
+retries here: each retry would cost another batch round trip.
+
+The node never waits for a batch. Submitted batch IDs are stored in Redis,
+keyed by the graph's thread_id and the request content; while a batch is
+still processing the node raises BatchPending, and the caller re-runs the
+graph later with the same thread_id to resume it rather than resubmit.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from functools import cache
+from typing import TYPE_CHECKING
+
+import orjson
+import structlog
+from langchain_core.runnables import RunnableConfig
+from pydantic import ValidationError
+
+from api.config import settings
+
+from api.services.extraction.nodes import compiler, evaluator, router
+from api.services.extraction.nodes.quality_gate import compute_quality_score
+from api.services.extraction.state import AgentState, ThreadResult
+
+if TYPE_CHECKING:
+    import anthropic
+    import redis
+
+logger = structlog.get_logger()
+
+BATCH_POLL_INTERVAL = 30  # seconds between re-runs while a batch is processing
+BATCH_ID_TTL = 48 * 3600  # batches end within 24h
+
+
+class BatchPending(Exception):
+    """A Message Batch the node depends on has not ended yet."""
+
+    def __init__(self, batch_id: str):
+        super().__init__(f"Message Batch {batch_id} still processing")
+        self.batch_id = batch_id
+
+
+@cache
+def _get_client() -> anthropic.Anthropic:
+    import anthropic
+
+    return anthropic.Anthropic()
+
+
+@cache
+def _get_redis() -> redis.Redis:
+    import redis
+
+    return redis.Redis.from_url(settings.REDIS_URL)
+
+
+@cache
+def _compiler_tool() -> dict:
+    """The tool definition with_structured_output() sends in online mode."""
+    from langchain_anthropic.chat_models import convert_to_anthropic_tool
+
+    return convert_to_anthropic_tool(compiler.ExtractedKnowledge)
+
+
+def _request(custom_id: str, model: str, max_tokens: int, messages: list, **extra) -> dict:
+    """One batch entry from a node's [SystemMessage, HumanMessage] prompt."""
+    system, human = messages
+    return {
+        "custom_id": custom_id,
+        "params": {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": 0,
+            "system": system.content,
+            "messages": [{"role": "user", "content": human.content}],
+            **extra,
+        },
+    }
+
+
+def _run_batch(requests: list[dict], job: str) -> dict[str, list]:
+    """Content blocks by custom_id of the ended Message Batch for these requests.
+
+    Submits the batch on first call for `job` and these exact requests; later
+    calls resume the stored batch. Raises BatchPending until it has ended.
+    Requests that errored, expired or were canceled are missing from the result.
+    """
+    client = _get_client()
+    store = _get_redis()
+    digest = hashlib.blake2b(orjson.dumps(requests), digest_size=16).hexdigest()
+    key = f"nw:llm_batch:{job}:{digest}"
+
+    if (batch_id := store.get(key)) is not None:
+        batch = client.messages.batches.retrieve(batch_id.decode())
+    else:
+        batch = client.messages.batches.create(requests=requests)
+        if store.set(key, batch.id, nx=True, ex=BATCH_ID_TTL):
+            logger.info("llm_batch_submitted", batch_id=batch.id, requests=len(requests))
+        else:
+            # A concurrent run of the same job submitted first: keep its batch
+            client.messages.batches.cancel(batch.id)
+            batch = client.messages.batches.retrieve(store.get(key).decode())
+
+    if batch.processing_status != "ended":
+        raise BatchPending(batch.id)
+
+    counts = batch.request_counts
+    logger.info(
+        "llm_batch_ended",
+        batch_id=batch.id,
+        succeeded=counts.succeeded,
+        errored=counts.errored,
+        expired=counts.expired,
+    )
+
+    return {
+        entry.custom_id: entry.result.message.content
+        for entry in client.messages.batches.results(batch.id)
+        if entry.result.type == "succeeded"
+    }
+
+
+def _text(blocks: list) -> str:
+    return "".join(block.text for block in blocks if block.type == "text")
+
+
+def _compiled(blocks: list, article_type: str) -> dict | None:
+    for block in blocks:
+        if block.type == "tool_use" and block.name == _compiler_tool()["name"]:
+            try:
+                result = compiler.ExtractedKnowledge.model_validate(block.input)
+            except ValidationError as e:
+                logger.error("compiler_failed", error=str(e))
+                return None
+            return compiler._to_compiled(result, article_type)
+    logger.error("compiler_failed", error="no ExtractedKnowledge tool call in batch result")
+    return None
+
+
+def batch_extract_node(state: AgentState, config: RunnableConfig) -> dict:
+    """Classify, evaluate and compile every thread through Message Batches."""
+    job = config["configurable"]["thread_id"]
+    thread_states = [
+        {**state, "current_thread_idx": idx} for idx in range(len(state["threads"]))
+    ]
+    if not thread_states:
+        return {"thread_results": []}
+    rejected = [evaluator.structural_rejection(thread) for thread in state["threads"]]
+
+    # Round 1: classification + evaluation
+    requests = []
+    for idx, thread_state in enumerate(thread_states):
+        requests.append(_request(
+            f"route-{idx}", router.MODEL, router.MAX_TOKENS,
+            router._classification_messages(thread_state),
+        ))
+        if not rejected[idx]:
+            requests.append(_request(
+                f"eval-{idx}", evaluator.MODEL, evaluator.MAX_TOKENS,
+                evaluator._evaluation_messages(thread_state),
+            ))
+    answers = _run_batch(requests, job)
+
+    results: list[ThreadResult] = []
+    for idx, thread_state in enumerate(thread_states):
+        # A failed classification drops the thread, as a NOISE verdict would
+        routed = (
+            router._parse_classification(_text(answers[f"route-{idx}"]))
+            if f"route-{idx}" in answers
+            else {"classification": "NOISE", "article_type": ""}
+        )
+        evaluation = None
+        if routed["classification"] != "NOISE":
+            evaluation = rejected[idx] or evaluator._parse_evaluation(
+                _text(answers.get(f"eval-{idx}", []))
+            )
+        results.append(ThreadResult(
+            **routed, evaluation=evaluation, compiled_article=None, quality_score=0.0,
+        ))
+        thread_state.update(routed, evaluation=evaluation)
+
+    # Round 2: compile what the evaluator would have let through
+    to_compile = {
+        idx: compiler._compile_messages(thread_state)
+        for idx, thread_state in enumerate(thread_states)
+        if not rejected[idx] and evaluator.route_after_evaluation(thread_state) == "compiler"
+    }
+    if to_compile:
+        tool = _compiler_tool()
+        answers = _run_batch([
+            _request(
+                f"compile-{idx}", compiler.MODEL, compiler.MAX_TOKENS, messages,
+                tools=[tool],
+                tool_choice={"type": "tool", "name": tool["name"]},
+            )
+            for idx, (_, messages) in to_compile.items()
+        ], job)
+        for idx, (article_type, _) in to_compile.items():
+            compiled = _compiled(answers.get(f"compile-{idx}", []), article_type)
+            results[idx]["compiled_article"] = compiled
+            results[idx]["quality_score"] = compute_quality_score(compiled)
+
+    logger.info(
+        "batch_extract_complete",
+        threads=len(results),
+        compiled=len(to_compile),
+        articles=sum(r["compiled_article"] is not None for r in results),
+    )
+    return {"thread_results": results}
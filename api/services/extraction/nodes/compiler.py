@@ -5,16 +5,25 @@ Adapts output based on article_type:
   QUESTION_ANSWER: symptom=question, diagnosis=context, solution=answer
   GUIDE: symptom=topic, diagnosis=prerequisites, solution=guide content
   DISCUSSION_SUMMARY: symptom=topic, diagnosis=perspectives, solution=takeaways
+
+The async node streams the ExtractedKnowledge tool call and stops generating
+as soon as the article can no longer pass the quality gate.
 """
 
 from __future__ import annotations
 
+import hashlib
+from contextlib import aclosing
+from functools import cache
+
 import structlog
-from langchain_anthropic import ChatAnthropic
+from cachetools import LRUCache
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
-from api.services.extraction.state import AgentState
+from api.services.extraction.nodes.evaluator import structural_rejection
+from api.services.extraction.nodes.quality_gate import QUALITY_THRESHOLD, max_quality_score
+from api.services.extraction.state import ARTICLE_TYPES, AgentState, ThreadMessage
 
 logger = structlog.get_logger()
 
@@ -53,6 +62,9 @@ RULES:
 - confidence: 0.9+ clear/confirmed, 0.7-0.9 good but gaps, 0.5-0.7 uncertain
 - Do NOT hallucinate. Only extract what was ACTUALLY discussed."""
 
+# One system prompt per article type, formatted once
+_PROMPTS = {t: COMPILER_SYSTEM_PROMPT.format(article_type=t) for t in ARTICLE_TYPES}
+
 
 class ExtractedKnowledge(BaseModel):
     """Pydantic schema for structured knowledge extraction."""
@@ -70,53 +82,143 @@ class ExtractedKnowledge(BaseModel):
     source_url: str | None = Field(default=None, description="URL to original discussion")
 
 
-_structured_llm = None
+MODEL = "claude-haiku-4-5-20251001"
+MAX_TOKENS = 1500
+# Bump when the prompt or ExtractedKnowledge changes: invalidates cached articles
+COMPILER_PROMPT_VERSION = 1
+
+# Content hash of the compile prompt -> compiled article. The compiler runs at
+# temperature 0, so checkpoint resumes and reprocessing of an unchanged thread
+# are served from here instead of repeating the LLM call.
+_compiled: LRUCache[str, dict] = LRUCache(maxsize=2048)
 
 
+@cache
 def _get_structured_llm():
-    global _structured_llm
-    if _structured_llm is None:
-        llm = ChatAnthropic(model="claude-haiku-4-5-20251001", temperature=0, max_tokens=1500)
-        _structured_llm = llm.with_structured_output(ExtractedKnowledge)
-    return _structured_llm
+    from langchain_anthropic import ChatAnthropic
 
+    llm = ChatAnthropic(model=MODEL, temperature=0, max_tokens=MAX_TOKENS)
+    return llm.with_structured_output(ExtractedKnowledge)
 
-def _format_thread(thread: list[dict]) -> str:
-    lines = []
-    for m in thread:
-        author = m.get("author_hash", "???")[:8]
-        ts = m.get("timestamp", "")
-        content = m.get("content", "")
-        lines.append(f"[{ts}] {author}: {content}")
-    return "\n".join(lines)
 
+@cache
+def _get_streaming_llm():
+    """Chat model forced to call ExtractedKnowledge; its arguments can be streamed."""
+    from langchain_anthropic import ChatAnthropic
 
-def compiler_node(state: AgentState) -> dict:
-    """Compile the current thread into structured knowledge."""
+    llm = ChatAnthropic(model=MODEL, temperature=0, max_tokens=MAX_TOKENS)
+    return llm.bind_tools([ExtractedKnowledge], tool_choice=ExtractedKnowledge.__name__)
+
+
+def _format_thread(thread: list[ThreadMessage]) -> str:
+    # disentangle_node fills every ThreadMessage key, so no .get() fallbacks
+    return "\n".join(
+        f"[{m['timestamp']}] {m['author_hash'][:8]}: {m['content']}" for m in thread
+    )
+
+
+def _compile_messages(state: AgentState) -> tuple[str, list]:
+    """Return the normalized article_type and the LLM messages for the current thread."""
     thread = state["threads"][state["current_thread_idx"]]
     formatted = _format_thread(thread)
     article_type = state.get("article_type", "TROUBLESHOOTING").lower()
 
-    prompt = COMPILER_SYSTEM_PROMPT.format(article_type=article_type.upper())
+    prompt = _PROMPTS.get(article_type.upper(), _PROMPTS["TROUBLESHOOTING"])
+    return article_type, [
+        # Cache breakpoint after the fixed system prompt; the thread varies
+        SystemMessage(content=[
+            {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}},
+        ]),
+        HumanMessage(content=f"Compile this thread:\n\n{formatted}"),
+    ]
+
+
+def _to_compiled(result: ExtractedKnowledge, article_type: str) -> dict:
+    compiled = result.model_dump()
+    # Ensure article_type matches router classification
+    compiled["article_type"] = article_type
+    logger.info(
+        "compiler_success",
+        article_type=article_type,
+        summary=compiled["thread_summary"][:80],
+        confidence=compiled["confidence"],
+        tags=compiled["tags"],
+    )
+    return compiled
+
+
+def _cache_key(messages: list) -> str:
+    digest = hashlib.blake2b(f"{COMPILER_PROMPT_VERSION}:{MODEL}".encode(), digest_size=16)
+    for message in messages:
+        digest.update(b"\0" + message.text.encode())
+    return digest.hexdigest()
+
+
+def compiler_node(state: AgentState) -> dict:
+    """Compile the current thread into structured knowledge."""
+    # GUIDE / DISCUSSION_SUMMARY reach the compiler whatever the evaluation
+    # says, so the evaluator's structural check is repeated here
+    if structural_rejection(state["threads"][state["current_thread_idx"]]):
+        return {"compiled_article": None, "compile_failed": False}
+
+    article_type, messages = _compile_messages(state)
+    key = _cache_key(messages)
+    if (compiled := _compiled.get(key)) is not None:
+        # Copy: callers add fields (source_url) to the returned article
+        return {"compiled_article": dict(compiled), "compile_failed": False}
+
     structured_llm = _get_structured_llm()
 
     try:
-        result: ExtractedKnowledge = structured_llm.invoke([
-            SystemMessage(content=prompt),
-            HumanMessage(content=f"Compile this thread:\n\n{formatted}"),
-        ])
-        compiled = result.model_dump()
-        # Ensure article_type matches router classification
-        compiled["article_type"] = article_type
-        logger.info(
-            "compiler_success",
-            article_type=article_type,
-            summary=compiled["thread_summary"][:80],
-            confidence=compiled["confidence"],
-            tags=compiled["tags"],
-        )
+        result: ExtractedKnowledge = structured_llm.invoke(messages)
+        compiled = _compiled[key] = _to_compiled(result, article_type)
+    except Exception as e:
+        logger.error("compiler_failed", error=str(e))
+        return {"compiled_article": None, "compile_failed": True}
+
+    return {"compiled_article": dict(compiled), "compile_failed": False}
+
+
+async def _stream_compile(messages: list, article_type: str) -> dict:
+    """Stream the tool call; return the partial arguments early if the gate must fail.
+
+    Every key of the partially parsed arguments except the last one is final,
+    so each time a new key starts the article is scored at its best case.
+    """
+    message = None
+    seen = 0
+    async with aclosing(_get_streaming_llm().astream(messages)) as stream:
+        async for chunk in stream:
+            message = chunk if message is None else message + chunk
+            if not message.tool_calls or len(args := message.tool_calls[0]["args"]) == seen:
+                continue
+            seen = len(args)
+            partial = {**args, "article_type": article_type}
+            if max_quality_score(partial, complete=list(args)[:-1]) < QUALITY_THRESHOLD:
+                # Leaving the block closes the stream, which stops generation
+                logger.warning("compiler_early_reject", article_type=article_type, fields=seen)
+                return partial
+
+    result = ExtractedKnowledge.model_validate(message.tool_calls[0]["args"])
+    return _to_compiled(result, article_type)
+
+
+async def acompiler_node(state: AgentState) -> dict:
+    """Async compiler_node, used when the graph runs via ainvoke/abatch."""
+    if structural_rejection(state["threads"][state["current_thread_idx"]]):
+        return {"compiled_article": None, "compile_failed": False}
+
+    article_type, messages = _compile_messages(state)
+    key = _cache_key(messages)
+    if (compiled := _compiled.get(key)) is not None:
+        return {"compiled_article": dict(compiled), "compile_failed": False}
+
+    try:
+        # An early-rejected partial article is cached too: at temperature 0 a
+        # retry would be cut off at the same point
+        compiled = _compiled[key] = await _stream_compile(messages, article_type)
     except Exception as e:
         logger.error("compiler_failed", error=str(e))
-        compiled = None
+        return {"compiled_article": None, "compile_failed": True}
 
-    return {"compiled_article": compiled}
+    return {"compiled_article": dict(compiled), "compile_failed": False}
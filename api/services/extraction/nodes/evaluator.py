@@ -1,5 +1,8 @@
 """Evaluator Node — assesses whether a thread has enough substance to compile.
 
+Threads shorter than MIN_THREAD_MESSAGES without any code are rejected
+structurally, without an LLM call.
+
 Article-type-aware routing:
   TROUBLESHOOTING: needs has_solution + (has_code OR is_resolved)
   QUESTION_ANSWER: needs has_solution (code optional)
@@ -8,12 +11,19 @@ Article-type-aware routing:
 
 from __future__ import annotations
 
-import json
+import hashlib
+from functools import cache
+from itertools import product
+from typing import TYPE_CHECKING
 
-from langchain_anthropic import ChatAnthropic
+import orjson
+from cachetools import LRUCache
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from api.services.extraction.state import AgentState, EvaluationResult
+from api.services.extraction.state import AgentState, EvaluationResult, ThreadMessage
+
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
 
 EVALUATOR_SYSTEM_PROMPT = """You are evaluating a community discussion thread.
 
@@ -31,90 +41,145 @@ Respond with ONLY a JSON object:
   "reasoning": "Brief explanation"
 }"""
 
-_llm: ChatAnthropic | None = None
+MODEL = "claude-haiku-4-5-20251001"
+MAX_TOKENS = 300
+# Bump when the prompt or response parsing changes: invalidates cached evaluations
+EVALUATOR_PROMPT_VERSION = 1
+
+# Content hash of the evaluation prompt -> result. Checkpoint resumes re-run the
+# evaluator on unchanged threads; those are answered without an LLM round trip.
+_evaluations: LRUCache[str, EvaluationResult] = LRUCache(maxsize=2048)
+
+# Fewer messages than this, and no code, can't carry problem + answer + confirmation
+MIN_THREAD_MESSAGES = 3
 
 
+@cache
 def _get_llm() -> ChatAnthropic:
-    global _llm
-    if _llm is None:
-        _llm = ChatAnthropic(model="claude-haiku-4-5-20251001", temperature=0, max_tokens=300)
-    return _llm
+    from langchain_anthropic import ChatAnthropic
 
+    return ChatAnthropic(model=MODEL, temperature=0, max_tokens=MAX_TOKENS)
 
-def _format_thread(thread: list[dict]) -> str:
-    lines = []
-    for m in thread:
-        author = m.get("author_hash", "???")[:8]
-        ts = m.get("timestamp", "")
-        content = m.get("content", "")
-        lines.append(f"[{ts}] {author}: {content}")
-    return "\n".join(lines)
+
+def _format_thread(thread: list[ThreadMessage]) -> str:
+    # disentangle_node fills every ThreadMessage key, so no .get() fallbacks
+    return "\n".join(
+        f"[{m['timestamp']}] {m['author_hash'][:8]}: {m['content']}" for m in thread
+    )
 
 
 def _parse_evaluation(content: str) -> EvaluationResult:
+    # The JSON object spans the first "{" to the last "}", with or without a
+    # markdown fence or prose around it
     text = content.strip()
-    if "```" in text:
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start != -1 and end > start:
-            text = text[start:end]
     try:
-        data = json.loads(text)
+        data = orjson.loads(text[text.find("{"):text.rfind("}") + 1])
         return EvaluationResult(
             has_solution=bool(data.get("has_solution", False)),
             has_code=bool(data.get("has_code", False)),
             is_resolved=bool(data.get("is_resolved", False)),
             reasoning=str(data.get("reasoning", "")),
         )
-    except (json.JSONDecodeError, KeyError, TypeError):
+    except (orjson.JSONDecodeError, AttributeError):
         return EvaluationResult(
             has_solution=False, has_code=False, is_resolved=False,
             reasoning=f"Failed to parse LLM response: {content[:200]}",
         )
 
 
-def evaluator_node(state: AgentState) -> dict:
-    """Evaluate whether the current thread has enough substance."""
+def structural_rejection(thread: list[ThreadMessage]) -> EvaluationResult | None:
+    """Pre-LLM check: the evaluation for a thread too thin to be worth an LLM call."""
+    if len(thread) >= MIN_THREAD_MESSAGES or any("```" in m["content"] for m in thread):
+        return None
+    return EvaluationResult(
+        has_solution=False, has_code=False, is_resolved=False, reasoning="structural:too_short",
+    )
+
+
+def _evaluation_messages(state: AgentState) -> list:
     thread = state["threads"][state["current_thread_idx"]]
     formatted = _format_thread(thread)
-    llm = _get_llm()
-    response = llm.invoke([
-        SystemMessage(content=EVALUATOR_SYSTEM_PROMPT),
+    return [
+        # Cache breakpoint after the fixed system prompt; the thread varies
+        SystemMessage(content=[
+            {
+                "type": "text",
+                "text": EVALUATOR_SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            },
+        ]),
         HumanMessage(content=f"Evaluate this thread:\n\n{formatted}"),
-    ])
-    evaluation = _parse_evaluation(response.content)
+    ]
+
+
+def _cache_key(messages: list) -> str:
+    digest = hashlib.sha256(f"{EVALUATOR_PROMPT_VERSION}:{MODEL}".encode())
+    for message in messages:
+        digest.update(b"\0" + message.text.encode())
+    return digest.hexdigest()
+
+
+def evaluator_node(state: AgentState) -> dict:
+    """Evaluate whether the current thread has enough substance."""
+    if rejected := structural_rejection(state["threads"][state["current_thread_idx"]]):
+        return {"evaluation": rejected}
+
+    messages = _evaluation_messages(state)
+    key = _cache_key(messages)
+    if (evaluation := _evaluations.get(key)) is None:
+        response = _get_llm().invoke(messages)
+        evaluation = _evaluations[key] = _parse_evaluation(response.content)
     return {"evaluation": evaluation}
 
 
+async def aevaluator_node(state: AgentState) -> dict:
+    """Async evaluator_node, used when the graph runs via ainvoke/abatch."""
+    if rejected := structural_rejection(state["threads"][state["current_thread_idx"]]):
+        return {"evaluation": rejected}
+
+    messages = _evaluation_messages(state)
+    key = _cache_key(messages)
+    if (evaluation := _evaluations.get(key)) is None:
+        response = await _get_llm().ainvoke(messages)
+        evaluation = _evaluations[key] = _parse_evaluation(response.content)
+    return {"evaluation": evaluation}
+
+
+# Whether an evaluation (has_solution, has_code, is_resolved) is complete
+# enough to compile, per article type
+_COMPILE_RULES = {
+    # needs solution + (code or explicit resolution); resolved code fixes count too
+    "TROUBLESHOOTING": lambda solution, code, resolved: (
+        (solution and (code or resolved)) or (code and resolved)
+    ),
+    # needs a solution, code is optional
+    "QUESTION_ANSWER": lambda solution, code, resolved: solution,
+    # inherently complete
+    "GUIDE": lambda solution, code, resolved: True,
+    "DISCUSSION_SUMMARY": lambda solution, code, resolved: True,
+}
+
+# (article_type, has_solution, has_code, is_resolved) -> next node, for every case
+_ROUTES = {
+    (article_type, *flags): "compiler" if rule(*flags) else "__end__"
+    for article_type, rule in _COMPILE_RULES.items()
+    for flags in product((False, True), repeat=3)
+}
+
+
 def route_after_evaluation(state: AgentState) -> str:
     """Article-type-aware routing to compiler or checkpoint.
 
     TROUBLESHOOTING: needs solution + (code or resolution)
     QUESTION_ANSWER: needs solution (code optional)
     GUIDE / DISCUSSION_SUMMARY: always proceed
+    Unknown article types follow the TROUBLESHOOTING rule.
     """
     evaluation = state.get("evaluation")
     if not evaluation:
         return "__end__"
 
     article_type = state.get("article_type", "TROUBLESHOOTING")
-
-    # GUIDE and DISCUSSION_SUMMARY always proceed — inherently complete
-    if article_type in ("GUIDE", "DISCUSSION_SUMMARY"):
-        return "compiler"
-
-    # QUESTION_ANSWER: needs a solution, code is optional
-    if article_type == "QUESTION_ANSWER":
-        if evaluation["has_solution"]:
-            return "compiler"
-        return "__end__"
-
-    # TROUBLESHOOTING: needs solution + (code or explicit resolution)
-    if evaluation["is_resolved"] and evaluation["has_code"]:
-        return "compiler"
-    if evaluation["has_solution"] and evaluation["has_code"]:
-        return "compiler"
-    if evaluation["has_solution"] and evaluation["is_resolved"]:
-        return "compiler"
-
-    return "__end__"
+    flags = (evaluation["has_solution"], evaluation["has_code"], evaluation["is_resolved"])
+    route = _ROUTES.get((article_type, *flags))
+    return route if route is not None else _ROUTES["TROUBLESHOOTING", *flags]
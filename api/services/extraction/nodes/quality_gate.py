@@ -6,11 +6,15 @@ Score breakdown varies by article type:
   GUIDE: code weight redistributed to solution length
   DISCUSSION_SUMMARY: code weight redistributed to diagnosis (perspectives)
 
-Threshold: 0.70 for all types. Max 3 retries.
+Threshold: 0.70 for all types. Max 3 retries, only after a failed LLM call:
+compiles run at temperature 0 and are cached, so any other retry would
+produce the same article and the same score.
 """
 
 from __future__ import annotations
 
+from collections.abc import Collection
+
 import structlog
 
 from api.services.extraction.state import AgentState
@@ -87,6 +91,27 @@ def compute_quality_score(article: dict | None) -> float:
     return round(min(score, 1.0), 2)
 
 
+# Best case for each scored field: enough to earn its full weight
+_BEST_CASE = {
+    "solution": "x" * 201,
+    "diagnosis": "x" * 81,
+    "code_snippet": "x" * 51,
+    "tags": ["x"] * 5,
+    "confidence": 1.0,
+    "thread_summary": "x" * 11,
+}
+
+
+def max_quality_score(partial: dict, complete: Collection[str]) -> float:
+    """Highest score an article still being generated can reach.
+
+    Fields not in `complete` may still grow or appear, so they count at their
+    best case. Below QUALITY_THRESHOLD the article is certain to fail the gate.
+    """
+    best = {field: value for field, value in _BEST_CASE.items() if field not in complete}
+    return compute_quality_score({**partial, **best})
+
+
 def quality_gate_node(state: AgentState) -> dict:
     """Score the compiled article and update state."""
     article = state.get("compiled_article")
@@ -105,10 +130,10 @@ def quality_gate_node(state: AgentState) -> dict:
 
 
 def route_after_quality(state: AgentState) -> str:
-    """pass → end, retry → compiler, reject → end."""
+    """pass → end, retry → compiler (only after a failed LLM call), reject → end."""
     if state["quality_score"] >= QUALITY_THRESHOLD:
         return "__end__"
-    if state["retry_count"] < MAX_RETRIES:
+    if state.get("compile_failed") and state["retry_count"] < MAX_RETRIES:
         return "compiler"
     logger.error("quality_gate_rejected", score=state["quality_score"], retries=state["retry_count"])
     return "__end__"
@@ -6,14 +6,26 @@ Categories:
   QUESTION_ANSWER — "How do I X?" with answer (code optional)
   GUIDE — tutorial, walkthrough, architectural explanation
   DISCUSSION_SUMMARY — general discussion with valuable insights
+
+aclassify_threads() classifies many threads ROUTER_BATCH_SIZE per LLM call;
+router_node keeps a classification the state already carries.
 """
 
 from __future__ import annotations
 
-from langchain_anthropic import ChatAnthropic
+from functools import cache
+from typing import TYPE_CHECKING
+
+import orjson
+import structlog
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from api.services.extraction.state import AgentState, ARTICLE_TYPES
+from api.services.extraction.state import AgentState, ARTICLE_TYPES, ThreadMessage
+
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
+
+logger = structlog.get_logger()
 
 ROUTER_SYSTEM_PROMPT = """You are a community discussion classifier. Analyze a conversation thread and classify it.
 
@@ -34,38 +46,56 @@ Rules:
 
 Respond with JSON: {"classification": "CATEGORY", "reason": "one sentence"}"""
 
-_llm: ChatAnthropic | None = None
+# Same rules, one verdict per "=== THREAD <idx> ===" section
+ROUTER_BATCH_SYSTEM_PROMPT = ROUTER_SYSTEM_PROMPT.rsplit("\n\n", 1)[0] + """
+
+You will receive several threads, each starting with a "=== THREAD <idx> ===" line.
+Classify each thread independently.
 
+Respond with ONLY a JSON array, one entry per thread:
+[{"idx": 0, "classification": "CATEGORY"}, ...]"""
 
+MODEL = "claude-haiku-4-5-20251001"
+MAX_TOKENS = 150
+ROUTER_BATCH_SIZE = 8
+BATCH_MAX_TOKENS = 40 * ROUTER_BATCH_SIZE  # one array entry is ~20 tokens
+
+
+@cache
 def _get_llm() -> ChatAnthropic:
-    global _llm
-    if _llm is None:
-        _llm = ChatAnthropic(model="claude-haiku-4-5-20251001", temperature=0, max_tokens=150)
-    return _llm
+    from langchain_anthropic import ChatAnthropic
 
+    return ChatAnthropic(model=MODEL, temperature=0, max_tokens=MAX_TOKENS)
 
-def _format_thread(thread: list[dict]) -> str:
-    lines = []
-    for m in thread:
-        author = m.get("author_hash", "???")[:8]
-        ts = m.get("timestamp", "")
-        content = m.get("content", "")
-        lines.append(f"[{ts}] {author}: {content}")
-    return "\n".join(lines)
 
+@cache
+def _get_batch_llm() -> ChatAnthropic:
+    from langchain_anthropic import ChatAnthropic
 
-def router_node(state: AgentState) -> dict:
-    """Classify the current thread into a content category."""
+    return ChatAnthropic(model=MODEL, temperature=0, max_tokens=BATCH_MAX_TOKENS)
+
+
+def _format_thread(thread: list[ThreadMessage]) -> str:
+    # disentangle_node fills every ThreadMessage key, so no .get() fallbacks
+    return "\n".join(
+        f"[{m['timestamp']}] {m['author_hash'][:8]}: {m['content']}" for m in thread
+    )
+
+
+def _classification_messages(state: AgentState) -> list:
     thread = state["threads"][state["current_thread_idx"]]
     formatted = _format_thread(thread)
-
-    llm = _get_llm()
-    response = llm.invoke([
-        SystemMessage(content=ROUTER_SYSTEM_PROMPT),
+    return [
+        # Cache breakpoint after the fixed system prompt; the thread varies
+        SystemMessage(content=[
+            {"type": "text", "text": ROUTER_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+        ]),
         HumanMessage(content=f"Classify this thread:\n\n{formatted}"),
-    ])
+    ]
+
 
-    text = response.content.strip().upper()
+def _parse_classification(content: str) -> dict:
+    text = content.strip().upper()
 
     # Match against known categories
     classification = "QUESTION_ANSWER"  # default: broadest useful category
@@ -79,6 +109,86 @@ def router_node(state: AgentState) -> dict:
     return {"classification": classification, "article_type": article_type}
 
 
+def router_node(state: AgentState) -> dict:
+    """Classify the current thread into a content category."""
+    # Classified up front by aclassify_threads (extract_all_threads)
+    if state.get("classification"):
+        return {"classification": state["classification"], "article_type": state["article_type"]}
+
+    response = _get_llm().invoke(_classification_messages(state))
+    return _parse_classification(response.content)
+
+
+async def arouter_node(state: AgentState) -> dict:
+    """Async router_node, used when the graph runs via ainvoke/abatch."""
+    if state.get("classification"):
+        return {"classification": state["classification"], "article_type": state["article_type"]}
+
+    response = await _get_llm().ainvoke(_classification_messages(state))
+    return _parse_classification(response.content)
+
+
+def _batch_messages(threads: list[list[ThreadMessage]]) -> list:
+    sections = "".join(
+        f"\n\n=== THREAD {idx} ===\n{_format_thread(thread)}" for idx, thread in enumerate(threads)
+    )
+    return [
+        SystemMessage(content=[
+            {
+                "type": "text",
+                "text": ROUTER_BATCH_SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            },
+        ]),
+        HumanMessage(content=f"Classify these threads:{sections}"),
+    ]
+
+
+def _parse_batch(content: str, count: int) -> list[dict | None]:
+    """Per-thread classifications from a JSON array reply; None where it has no entry."""
+    results: list[dict | None] = [None] * count
+    text = content.strip()
+    try:
+        entries = orjson.loads(text[text.find("["):text.rfind("]") + 1])
+    except orjson.JSONDecodeError:
+        return results
+    for entry in entries if isinstance(entries, list) else ():
+        if not isinstance(entry, dict):
+            continue
+        idx, label = entry.get("idx"), entry.get("classification")
+        if isinstance(idx, int) and 0 <= idx < count and isinstance(label, str):
+            results[idx] = _parse_classification(label)
+    return results
+
+
+async def aclassify_threads(
+    threads: list[list[ThreadMessage]], concurrency: int | None = None
+) -> list[dict | None]:
+    """Classify threads ROUTER_BATCH_SIZE per LLM call, in thread order.
+
+    Threads the reply leaves out, and whole batches whose call fails, come back
+    as None; router_node then classifies those one by one.
+    """
+    chunks = [
+        threads[start:start + ROUTER_BATCH_SIZE]
+        for start in range(0, len(threads), ROUTER_BATCH_SIZE)
+    ]
+    responses = await _get_batch_llm().abatch(
+        [_batch_messages(chunk) for chunk in chunks],
+        config={"max_concurrency": concurrency},
+        return_exceptions=True,
+    )
+
+    results: list[dict | None] = []
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, Exception):
+            logger.warning("router_batch_failed", threads=len(chunk), error=str(response))
+            results.extend([None] * len(chunk))
+        else:
+            results.extend(_parse_batch(response.content, len(chunk)))
+    return results
+
+
 def route_after_classification(state: AgentState) -> str:
     """Conditional edge: NOISE → end, everything else → evaluator."""
     if state["classification"] == "NOISE":
@@ -50,6 +50,16 @@ class CompiledArticle(TypedDict):
     source_url: str | None
 
 
+class ThreadResult(TypedDict):
+    """Per-thread outcome of the batch_extract node (Message Batches mode)."""
+
+    classification: str
+    article_type: str
+    evaluation: EvaluationResult | None
+    compiled_article: CompiledArticle | None
+    quality_score: float
+
+
 class AgentState(TypedDict):
     """Main state schema flowing through the LangGraph pipeline."""
 
@@ -70,11 +80,15 @@ class AgentState(TypedDict):
 
     # --- Compiler output ---
     compiled_article: CompiledArticle | None
+    compile_failed: bool           # LLM call errored; the only outcome a retry can change
 
     # --- Quality gate ---
     quality_score: float
     retry_count: int
 
+    # --- Batch mode output (one slot per thread) ---
+    thread_results: list[ThreadResult]
+
     # --- Context ---
     current_thread_idx: int
     server_id: str
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import hashlib
 from datetime import datetime
+from functools import lru_cache
 
 import httpx
 import structlog
@@ -63,7 +64,13 @@ query($owner: String!, $repo: String!) {
 
 
 class GitHubDiscussionsFetcher:
-    """Fetches GitHub Discussions via GraphQL API."""
+    """Fetches GitHub Discussions via GraphQL API.
+
+    Queries share one HTTP/2 connection pool, opened by the first query, so
+    pagination reuses the TLS session. Use as
+    `async with GitHubDiscussionsFetcher(token) as fetcher:` (or await aclose())
+    within the event loop that runs the queries.
+    """
 
     def __init__(self, token: str):
         self.token = token
@@ -71,23 +78,39 @@ class GitHubDiscussionsFetcher:
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> GitHubDiscussionsFetcher:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def _graphql(self, query: str, variables: dict) -> dict:
         """Execute a GraphQL query against GitHub API."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                GITHUB_GRAPHQL_URL,
-                json={"query": query, "variables": variables},
+        if self._client is None:
+            self._client = httpx.AsyncClient(
                 headers=self.headers,
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=10),
             )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await self._client.post(
+            GITHUB_GRAPHQL_URL, json={"query": query, "variables": variables}
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
-            if "errors" in data:
-                logger.error("github_graphql_error", errors=data["errors"])
-                raise RuntimeError(f"GraphQL errors: {data['errors']}")
+        if "errors" in data:
+            logger.error("github_graphql_error", errors=data["errors"])
+            raise RuntimeError(f"GraphQL errors: {data['errors']}")
 
-            return data["data"]
+        return data["data"]
 
     async def fetch_categories(self, owner: str, repo: str) -> list[dict]:
         """Fetch discussion categories for a repository."""
@@ -172,6 +195,7 @@ class GitHubDiscussionsFetcher:
         return discussions
 
     @staticmethod
+    @lru_cache(maxsize=4096)  # the same few authors recur across a repo's discussions
     def hash_username(username: str) -> str:
         """SHA-256 hash a GitHub username for consistency with Discord flow."""
         return hashlib.sha256(username.encode()).hexdigest()
@@ -189,6 +213,7 @@ class GitHubDiscussionsFetcher:
             {id, author_hash, content, timestamp, reply_to, mentions}
         """
         messages = []
+        seen_ids = {discussion["id"]}
 
         # First message: discussion title + body
         op_content = f"# {discussion['title']}\n\n{discussion['body']}"
@@ -203,6 +228,7 @@ class GitHubDiscussionsFetcher:
 
         # Comments
         for comment in discussion.get("comments", []):
+            seen_ids.add(comment["id"])
             messages.append({
                 "id": comment["id"],
                 "author_hash": self.hash_username(comment["author"]),
@@ -214,7 +240,7 @@ class GitHubDiscussionsFetcher:
 
         # If there's an accepted answer and it's not already in comments
         answer = discussion.get("answer")
-        if answer and answer["id"] not in {m["id"] for m in messages}:
+        if answer and answer["id"] not in seen_ids:
             messages.append({
                 "id": answer["id"],
                 "author_hash": self.hash_username((answer.get("author") or {}).get("login", "ghost")),
@@ -7,10 +7,11 @@ and updates the export record.
 
 from __future__ import annotations
 
-import json
 import os
+from itertools import chain
 from pathlib import Path
 
+import orjson
 import structlog
 
 from api.celery_app import app
@@ -18,6 +19,8 @@ from api.celery_app import app
 logger = structlog.get_logger()
 
 EXPORT_DIR = Path(os.environ.get("EXPORT_DIR", "/tmp/neuroweave_exports"))
+# Articles fetched per round trip; only one batch of ORM objects is held at a time
+EXPORT_FETCH_SIZE = 500
 
 
 @app.task(
@@ -49,7 +52,7 @@ def export_dataset(
     from api.models.channel import Channel
     from api.models.dataset_export import DatasetExport
     from api.models.thread import Thread
-    from api.services.c2pa_signer import compute_content_hash, create_manifest, sign_manifest
+    from api.services.c2pa_signer import compute_file_hash, create_manifest, sign_manifest
 
     sync_url = settings.DATABASE_URL.replace("+asyncpg", "+psycopg2").replace("postgresql+psycopg2", "postgresql")
     engine = create_engine(sync_url)
@@ -68,49 +71,54 @@ def export_dataset(
             if language:
                 query = query.where(Article.language == language)
 
-            articles = session.execute(query).scalars().all()
+            # Streamed from a server-side cursor rather than loaded with .all()
+            articles = session.execute(
+                query.execution_options(yield_per=EXPORT_FETCH_SIZE)
+            ).scalars()
+            first = next(articles, None)
 
-            if not articles:
+            if first is None:
                 logger.warning("export_no_articles", export_id=export_id)
                 return
 
-            # Build JSONL content
-            lines = []
-            for article in articles:
-                record = {
-                    "id": f"art_{article.id}",
-                    "source": f"{article.source_type}:{server_id}",
-                    "knowledge": {
-                        "symptom": article.symptom,
-                        "diagnosis": article.diagnosis,
-                        "solution": article.solution,
-                        "code_snippet": article.code_snippet,
-                        "language": article.language,
-                        "framework": article.framework,
-                        "tags": article.tags,
-                        "confidence": article.confidence,
-                        "thread_summary": article.thread_summary,
-                    },
-                    "metadata": {
-                        "quality_score": article.quality_score,
-                        "created_at": article.created_at.isoformat() if article.created_at else None,
-                    },
-                }
-                lines.append(json.dumps(record, ensure_ascii=False))
-
-            content = "\n".join(lines)
-            content_bytes = content.encode("utf-8")
-
-            # Write file
+            # Stream JSONL records straight to the file
             EXPORT_DIR.mkdir(parents=True, exist_ok=True)
             file_path = EXPORT_DIR / f"export_{export_id}.jsonl"
-            file_path.write_bytes(content_bytes)
+            record_count = 0
+            with file_path.open("wb") as f:
+                for article in chain([first], articles):
+                    record = {
+                        "id": f"art_{article.id}",
+                        "source": f"{article.source_type}:{server_id}",
+                        "knowledge": {
+                            "symptom": article.symptom,
+                            "diagnosis": article.diagnosis,
+                            "solution": article.solution,
+                            "code_snippet": article.code_snippet,
+                            "language": article.language,
+                            "framework": article.framework,
+                            "tags": article.tags,
+                            "confidence": article.confidence,
+                            "thread_summary": article.thread_summary,
+                        },
+                        "metadata": {
+                            "quality_score": article.quality_score,
+                            "created_at": (
+                                article.created_at.isoformat() if article.created_at else None
+                            ),
+                        },
+                    }
+                    if record_count:
+                        f.write(b"\n")
+                    f.write(orjson.dumps(record))
+                    record_count += 1
+            file_size = file_path.stat().st_size
 
             # C2PA signing
-            content_hash = compute_content_hash(content_bytes)
+            content_hash = compute_file_hash(file_path)
             manifest = create_manifest(
                 export_id=export_id,
-                record_count=len(articles),
+                record_count=record_count,
                 content_hash=content_hash,
                 source_server=str(server_id),
             )
@@ -118,7 +126,7 @@ def export_dataset(
 
             # Write manifest alongside
             manifest_path = EXPORT_DIR / f"export_{export_id}.c2pa.json"
-            manifest_path.write_text(json.dumps(manifest, indent=2))
+            manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
 
             # Update export record
             export = session.execute(
@@ -126,9 +134,9 @@ def export_dataset(
             ).scalar_one_or_none()
 
             if export:
-                export.record_count = len(articles)
+                export.record_count = record_count
                 export.file_path = str(file_path)
-                export.file_size_bytes = len(content_bytes)
+                export.file_size_bytes = file_size
                 export.c2pa_manifest_hash = manifest_hash
                 export.consent_verified = True
                 session.commit()
@@ -136,8 +144,8 @@ def export_dataset(
             logger.info(
                 "export_complete",
                 export_id=export_id,
-                records=len(articles),
-                size_bytes=len(content_bytes),
+                records=record_count,
+                size_bytes=file_size,
                 manifest_hash=manifest_hash[:30],
             )
 
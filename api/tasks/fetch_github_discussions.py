@@ -67,12 +67,13 @@ def fetch_and_process(server_id: int):
 
         async def _fetch():
             all_discussions = []
-            if category_ids:
-                for cat_id in category_ids:
-                    discussions = await fetcher.fetch_discussions(owner, repo, category_id=cat_id, limit=10)
-                    all_discussions.extend(discussions)
-            else:
-                all_discussions = await fetcher.fetch_discussions(owner, repo, limit=20)
+            async with fetcher:
+                if category_ids:
+                    for cat_id in category_ids:
+                        discussions = await fetcher.fetch_discussions(owner, repo, category_id=cat_id, limit=10)
+                        all_discussions.extend(discussions)
+                else:
+                    all_discussions = await fetcher.fetch_discussions(owner, repo, limit=20)
             return all_discussions
 
         discussions = asyncio.run(_fetch())
@@ -60,7 +60,7 @@ def store_article(
             # Create thread record
             thread = Thread(
                 channel_id=channel.id,
-                status=ThreadStatus.RESOLVED,
+                status=ThreadStatus.RESOLVED.value,
                 cluster_metadata={"source": source_type},
             )
             session.add(thread)
@@ -8,7 +8,10 @@ Flow:
 
 from __future__ import annotations
 
+import asyncio
+import os
 import time
+from functools import cache
 
 import structlog
 
@@ -17,6 +20,19 @@ from api.celery_app import app
 logger = structlog.get_logger()
 
 
+@cache
+def _event_loop(pid: int) -> asyncio.AbstractEventLoop:
+    """One event loop per worker process, kept for the process lifetime.
+
+    The cached LLM clients pool their async HTTP connections on the loop they
+    first ran on; under a fresh asyncio.run() per task the next task's first
+    request would hit a connection of the closed loop. Keyed by pid so a
+    forked pool process never inherits its parent's loop. Not for the threads
+    pool: one task at a time per process.
+    """
+    return asyncio.new_event_loop()
+
+
 @app.task(
     bind=True,
     name="api.tasks.process_messages.process_message_batch",
@@ -31,6 +47,8 @@ def process_message_batch(
     messages: list[dict],
     source_type: str = "discord",
     source_url: str | None = None,
+    use_batch_api: bool = False,
+    batch_job: str | None = None,
 ):
     """Process a batch of messages through the extraction pipeline.
 
@@ -41,6 +59,12 @@ def process_message_batch(
             id, author_hash, content, timestamp, reply_to, mentions
         source_type: Source platform — "discord", "github", "discourse".
         source_url: URL to original discussion (GitHub, Discourse).
+        use_batch_api: Run the LLM steps through the Anthropic Message Batches
+            API (half price, minutes-to-hours latency). For backfills. While a
+            batch is processing the task re-enqueues itself every
+            BATCH_POLL_INTERVAL seconds instead of holding a worker.
+        batch_job: Set on those re-enqueued runs: the graph thread_id under
+            which the submitted batches are stored, so they are resumed.
     """
     logger.info(
         "processing_batch",
@@ -53,9 +77,10 @@ def process_message_batch(
     start = time.monotonic()
 
     try:
-        from api.services.anonymizer import anonymize
+        from api.services.anonymizer import anonymize_batch
         from api.services.consent_checker import filter_consented_messages
-        from api.services.extraction.graph import build_graph
+        from api.services.extraction.graph import build_graph, extract_all_threads
+        from api.services.extraction.nodes.batch_extract import BATCH_POLL_INTERVAL, BatchPending
 
         # GDPR: consent check (skip for public sources like GitHub)
         if source_type == "discord":
@@ -66,11 +91,11 @@ def process_message_batch(
         # GitHub/Discourse: public data, no consent needed
 
         # PII anonymization
-        for msg in messages:
-            result = anonymize(msg.get("content", ""))
+        results = anonymize_batch([msg.get("content", "") for msg in messages])
+        for msg, result in zip(messages, results, strict=True):
             msg["content"] = result.text
 
-        graph = build_graph(use_mongodb=True)
+        graph = build_graph(use_mongodb=True, use_batch_api=use_batch_api)
 
         initial_state = {
             "messages": messages,
@@ -89,31 +114,57 @@ def process_message_batch(
             "error": None,
         }
 
-        config = {
-            "configurable": {
-                "thread_id": f"batch_{source_type}_{channel_id}_{int(time.time())}",
-            }
-        }
-
-        result = graph.invoke(initial_state, config=config)
+        thread_id = f"batch_{source_type}_{channel_id}_{int(time.time())}"
+        if use_batch_api:
+            # Stable across self.retry (same task id) and re-enqueued polls
+            thread_id = batch_job or f"llm_batch_{source_type}_{channel_id}_{self.request.id}"
+            try:
+                # One graph run; batch_extract fans results out per thread
+                final = graph.invoke(
+                    initial_state, config={"configurable": {"thread_id": thread_id}}
+                )
+            except BatchPending as pending:
+                # Poll again later from a new task rather than sleeping here: a
+                # batch can take up to 24h. Messages go back consent-filtered and
+                # anonymized (re-anonymizing is a no-op), so no PII is re-queued.
+                process_message_batch.apply_async(
+                    kwargs={
+                        "channel_id": channel_id,
+                        "server_id": server_id,
+                        "messages": messages,
+                        "source_type": source_type,
+                        "source_url": source_url,
+                        "use_batch_api": True,
+                        "batch_job": thread_id,
+                    },
+                    countdown=BATCH_POLL_INTERVAL,
+                )
+                logger.info("batch_pending", batch_id=pending.batch_id, job=thread_id)
+                return {"pending": pending.batch_id}
+            results = final.get("thread_results", [])
+        else:
+            # Every disentangled thread goes through the graph; the LLM calls of
+            # concurrent threads overlap instead of running back to back
+            results = _event_loop(os.getpid()).run_until_complete(
+                extract_all_threads(graph, initial_state, thread_id=thread_id)
+            )
 
         duration_ms = (time.monotonic() - start) * 1000
 
-        classification = result.get("classification", "")
-        quality = result.get("quality_score", 0)
-
-        logger.info(
-            "batch_complete",
-            channel=channel_id,
-            source=source_type,
-            classification=classification,
-            quality=quality,
-            duration_ms=round(duration_ms),
-        )
-
-        # Store successful articles
-        if quality >= 0.7 and result.get("compiled_article"):
-            from api.tasks.generate_article import store_article
+        from api.tasks.generate_article import store_article
+
+        stored = 0
+        for idx, result in enumerate(results):
+            if isinstance(result, Exception):
+                # One failed thread shouldn't cost the rest of the batch a retry
+                logger.warning(
+                    "thread_extraction_failed", channel=channel_id, thread=idx, error=str(result),
+                )
+                continue
+            quality = result.get("quality_score", 0)
+            # Store successful articles
+            if quality < 0.7 or not result.get("compiled_article"):
+                continue
 
             compiled = result["compiled_article"]
             # Inject source_url if not already set by compiler
@@ -127,10 +178,20 @@ def process_message_batch(
                 quality_score=quality,
                 source_type=source_type,
             )
+            stored += 1
+
+        logger.info(
+            "batch_complete",
+            channel=channel_id,
+            source=source_type,
+            threads=len(results),
+            articles=stored,
+            duration_ms=round(duration_ms),
+        )
 
         return {
-            "classification": classification,
-            "quality_score": quality,
+            "threads": len(results),
+            "articles": stored,
             "duration_ms": round(duration_ms),
         }
 
@@ -46,6 +46,12 @@ def main():
     fetcher = GitHubDiscussionsFetcher(settings.GITHUB_TOKEN)
 
     async def run():
+        async with fetcher:
+            discussions = await fetch()
+        if discussions is not None:
+            await process(discussions)
+
+    async def fetch():
         # Fetch categories
         print(f"Fetching categories for {owner}/{repo}...")
         categories = await fetcher.fetch_categories(owner, repo)
@@ -74,8 +80,10 @@ def main():
 
         if args.dry_run:
             print("\n--dry-run: skipping pipeline processing")
-            return
+            return None
+        return discussions
 
+    async def process(discussions):
         # Process through pipeline
         if not settings.ANTHROPIC_API_KEY:
             print("\nWarning: ANTHROPIC_API_KEY not set, skipping pipeline")
@@ -94,16 +102,16 @@ def main():
             channel_id = category.get("id", "uncategorized")
 
             try:
-                result = process_message_batch(
+                # The task drives its own event loop, so it runs off this one
+                result = await asyncio.to_thread(
+                    process_message_batch,
                     channel_id=channel_id,
                     server_id=f"{owner}/{repo}",
                     messages=messages,
                     source_type="github",
                     source_url=d.get("url"),
                 )
-                quality = result.get("quality_score", 0)
-                classification = result.get("classification", "?")
-                print(f"  [{classification}] {d['title'][:50]} → quality={quality}")
+                print(f"  {d['title'][:50]} → {result.get('articles', 0)} article(s)")
                 processed += 1
             except Exception as e:
                 print(f"  ERROR: {d['title'][:50]} → {e}")
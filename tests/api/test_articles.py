@@ -26,6 +26,16 @@ class TestArticleEndpoints:
         )
         assert r.status_code in (200, 500)
 
+    def test_bulk_moderate_requires_auth(self, client):
+        r = client.patch("/api/articles/moderate", json={"ids": [1], "is_visible": False})
+        assert r.status_code == 401
+
+    def test_bulk_moderate_validates_ids(self, client, auth_headers):
+        r = client.patch(
+            "/api/articles/moderate", json={"ids": [], "is_visible": False}, headers=auth_headers
+        )
+        assert r.status_code == 422
+
     def test_list_articles_validates_pagination(self, client):
         r = client.get("/api/servers/1/articles?page=0")
         assert r.status_code == 422
@@ -30,6 +30,17 @@ class TestAuth:
         r = client.get("/api/auth/me", headers={"Authorization": "Bearer invalid.token.here"})
         assert r.status_code == 401
 
+    def test_me_cached_token_expiry_rechecked(self, client, auth_headers):
+        """A cached payload past its exp is not served; the token is decoded again."""
+        from api.deps import _token_cache
+
+        assert client.get("/api/auth/me", headers=auth_headers).status_code == 200
+        for payload in _token_cache.values():
+            payload["exp"] = 0
+        r = client.get("/api/auth/me", headers=auth_headers)
+        assert r.status_code == 200  # re-decoded from the token, real exp is 2030
+        _token_cache.clear()
+
 
 class TestHealthCheck:
     def test_health(self, client):
@@ -10,6 +10,13 @@ class TestDatasetEndpoints:
         r = client.get("/api/datasets")
         assert r.status_code in (200, 500)
 
+    def test_list_exports_validates_pagination(self, client):
+        r = client.get("/api/datasets?limit=500")
+        assert r.status_code == 422
+
+        r = client.get("/api/datasets?offset=-1")
+        assert r.status_code == 422
+
     def test_download_not_found(self, client):
         r = client.get("/api/datasets/99999/download")
         assert r.status_code in (404, 500)
@@ -6,6 +6,14 @@ class TestGitHubEndpoints:
         r = client.get("/api/github/repos")
         assert r.status_code in (200, 500)
 
+    def test_list_repos_conditional_get(self, client):
+        r = client.get("/api/github/repos")
+        assert r.status_code in (200, 500)
+        if r.status_code == 200:
+            r = client.get("/api/github/repos", headers={"If-None-Match": r.headers["etag"]})
+            assert r.status_code == 304
+            assert r.content == b""
+
     def test_add_repo_validation(self, client):
         r = client.post("/api/github/repos", json={})
         assert r.status_code == 422
@@ -7,6 +7,14 @@ from datetime import datetime, timedelta
 import pytest
 
 from api.services.extraction.disentanglement import RawMessage
+from api.services.extraction.nodes import compiler, evaluator
+
+
+@pytest.fixture(autouse=True)
+def _clear_llm_caches():
+    """LLM node results are memoized per process; keep tests independent."""
+    evaluator._evaluations.clear()
+    compiler._compiled.clear()
 
 
 @pytest.fixture
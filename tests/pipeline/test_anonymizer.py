@@ -110,6 +110,32 @@ class TestAnonymizeMixed:
         assert "def hello():" in r.text
         assert "print('world')" in r.text
 
+    def test_mention_does_not_take_ip(self):
+        r = anonymize("ssh user@10.0.0.5")
+        assert r.text == "ssh user@[IP]"
+
+    def test_phone_does_not_split_ipv6(self):
+        r = anonymize("call me at 555 123 4567 2001:db8:85a3:0:0:8a2e:370:7334")
+        assert r.text == "call me at [PHONE] [IP]"
+
+    def test_skipped_localhost_does_not_block_later_patterns(self):
+        r = anonymize("ping 127.0.0.1 then @alice")
+        assert r.text == "ping 127.0.0.1 then [USER]"
+
+    def test_offsets_refer_to_original_text(self):
+        text = "Hey @john, mail debug@company.com from 192.168.1.50"
+        r = anonymize(text)
+        assert [red.type for red in r.redactions] == ["DISCORD_MENTION", "EMAIL", "IPV4"]
+        assert all(text[red.start:red.end] == red.original for red in r.redactions)
+
+    def test_many_redactions_spliced_in_order(self):
+        text = " ".join(f"@user{i} mailed u{i}@example.com" for i in range(300))
+        r = anonymize(text)
+        assert r.redaction_count == 600
+        assert r.text == " ".join("[USER] mailed [EMAIL]" for _ in range(300))
+        starts = [red.start for red in r.redactions]
+        assert starts == sorted(starts)
+
     def test_empty_string(self):
         r = anonymize("")
         assert r.text == ""
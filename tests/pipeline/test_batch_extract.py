@@ -0,0 +1,123 @@
+"""Tests for the Batch Extract Node (Message Batches mode)."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from api.services.extraction.nodes.batch_extract import BatchPending, _run_batch, batch_extract_node
+
+CONFIG = {"configurable": {"thread_id": "job-1"}}
+
+
+def _text(content):
+    return [SimpleNamespace(type="text", text=content)]
+
+
+def _tool_call(article):
+    return [SimpleNamespace(type="tool_use", name="ExtractedKnowledge", input=article)]
+
+
+RESOLVED = '{"has_solution": true, "has_code": true, "is_resolved": true, "reasoning": "fixed"}'
+
+
+class TestBatchExtractNode:
+    @patch("api.services.extraction.nodes.batch_extract._run_batch")
+    def test_fans_results_out_per_thread(
+        self, mock_run_batch, tech_thread, noise_thread, high_quality_article
+    ):
+        mock_run_batch.side_effect = [
+            {
+                "route-0": _text('{"classification": "TROUBLESHOOTING"}'),
+                "eval-0": _text(RESOLVED),
+                "route-1": _text('{"classification": "NOISE"}'),
+                "eval-1": _text(RESOLVED),
+            },
+            {"compile-0": _tool_call(high_quality_article)},
+        ]
+
+        result = batch_extract_node({"threads": [tech_thread, noise_thread]}, CONFIG)
+        first, second = result["thread_results"]
+
+        assert first["article_type"] == "TROUBLESHOOTING"
+        assert first["evaluation"]["is_resolved"] is True
+        assert first["compiled_article"]["article_type"] == "troubleshooting"
+        assert first["quality_score"] >= 0.7
+
+        assert second["classification"] == "NOISE"
+        assert second["evaluation"] is None
+        assert second["compiled_article"] is None
+
+        # Only the technical thread reaches the compile round, with the forced tool call
+        (compile_requests, job), _ = mock_run_batch.call_args
+        assert job == "job-1"
+        assert [r["custom_id"] for r in compile_requests] == ["compile-0"]
+        assert compile_requests[0]["params"]["tool_choice"] == {
+            "type": "tool", "name": "ExtractedKnowledge",
+        }
+
+    @patch("api.services.extraction.nodes.batch_extract._run_batch")
+    def test_failed_requests_yield_no_article(self, mock_run_batch, tech_thread):
+        mock_run_batch.side_effect = [
+            {"route-0": _text("GUIDE"), "eval-0": _text(RESOLVED)},
+            {},  # compile request errored
+        ]
+
+        result = batch_extract_node({"threads": [tech_thread]}, CONFIG)
+
+        assert result["thread_results"][0]["compiled_article"] is None
+        assert result["thread_results"][0]["quality_score"] == 0.0
+
+    @patch("api.services.extraction.nodes.batch_extract._run_batch")
+    def test_unresolved_threads_skip_compile_round(self, mock_run_batch, tech_thread):
+        mock_run_batch.return_value = {
+            "route-0": _text("TROUBLESHOOTING"),
+            "eval-0": _text('{"has_solution": false, "has_code": false, "is_resolved": false}'),
+        }
+
+        result = batch_extract_node({"threads": [tech_thread]}, CONFIG)
+
+        assert mock_run_batch.call_count == 1
+        assert result["thread_results"][0]["compiled_article"] is None
+
+    def test_no_threads(self):
+        assert batch_extract_node({"threads": []}, CONFIG) == {"thread_results": []}
+
+
+def _batch(status):
+    counts = SimpleNamespace(succeeded=1, errored=0, expired=0)
+    return SimpleNamespace(id="msgbatch_1", processing_status=status, request_counts=counts)
+
+
+@patch("api.services.extraction.nodes.batch_extract._get_redis")
+@patch("api.services.extraction.nodes.batch_extract._get_client")
+class TestRunBatch:
+    REQUESTS = [{"custom_id": "route-0", "params": {"model": "m"}}]
+
+    def test_submits_once_and_raises_until_ended(self, mock_get_client, mock_get_redis):
+        client = mock_get_client.return_value
+        store = mock_get_redis.return_value
+        client.messages.batches.create.return_value = _batch("in_progress")
+        store.get.return_value = None
+        store.set.return_value = True
+
+        with pytest.raises(BatchPending) as pending:
+            _run_batch(self.REQUESTS, "job-1")
+
+        assert pending.value.batch_id == "msgbatch_1"
+        key, batch_id = store.set.call_args.args
+        assert key.startswith("nw:llm_batch:job-1:") and batch_id == "msgbatch_1"
+
+    def test_resumes_stored_batch(self, mock_get_client, mock_get_redis):
+        client = mock_get_client.return_value
+        mock_get_redis.return_value.get.return_value = b"msgbatch_1"
+        client.messages.batches.retrieve.return_value = _batch("ended")
+        message = SimpleNamespace(content=["blocks"])
+        client.messages.batches.results.return_value = [
+            SimpleNamespace(custom_id="route-0", result=SimpleNamespace(type="succeeded", message=message)),
+            SimpleNamespace(custom_id="route-1", result=SimpleNamespace(type="errored")),
+        ]
+
+        assert _run_batch(self.REQUESTS, "job-1") == {"route-0": ["blocks"]}
+        client.messages.batches.create.assert_not_called()
+        client.messages.batches.retrieve.assert_called_once_with("msgbatch_1")
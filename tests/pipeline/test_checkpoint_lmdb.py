@@ -0,0 +1,74 @@
+"""Tests for the LMDB checkpointer."""
+
+import asyncio
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+
+pytest.importorskip("lmdb")
+
+from langgraph.graph import END, StateGraph  # noqa: E402
+
+from api.services.extraction.checkpoint import LMDBSaver  # noqa: E402
+
+
+class _State(TypedDict):
+    items: Annotated[list[str], operator.add]
+    count: int
+
+
+def _build(saver):
+    workflow = StateGraph(_State)
+    workflow.add_node("step", lambda state: {"items": ["x"], "count": state["count"] + 1})
+    workflow.set_entry_point("step")
+    workflow.add_edge("step", END)
+    return workflow.compile(checkpointer=saver)
+
+
+class TestLMDBSaver:
+    def test_state_survives_reopen(self, tmp_path):
+        config = {"configurable": {"thread_id": "t1"}}
+        saver = LMDBSaver(str(tmp_path))
+        _build(saver).invoke({"items": ["a"], "count": 0}, config)
+        saver.env.close()
+
+        graph = _build(LMDBSaver(str(tmp_path)))
+        state = graph.get_state(config)
+        assert state.values == {"items": ["a", "x"], "count": 1}
+
+        # Resuming the thread builds on the stored state
+        result = graph.invoke({"items": ["b"], "count": 1}, config)
+        assert result["items"] == ["a", "x", "b", "x"]
+
+    def test_history_newest_first(self, tmp_path):
+        config = {"configurable": {"thread_id": "t1"}}
+        graph = _build(LMDBSaver(str(tmp_path)))
+        graph.invoke({"items": [], "count": 0}, config)
+
+        history = list(graph.get_state_history(config))
+        ids = [snapshot.config["configurable"]["checkpoint_id"] for snapshot in history]
+        assert ids == sorted(ids, reverse=True)
+        assert history[0].values["count"] == 1
+        assert history[-1].parent_config is None
+
+    def test_threads_isolated_and_deleted(self, tmp_path):
+        saver = LMDBSaver(str(tmp_path))
+        graph = _build(saver)
+        graph.invoke({"items": ["a"], "count": 0}, {"configurable": {"thread_id": "t1"}})
+        graph.invoke({"items": ["b"], "count": 5}, {"configurable": {"thread_id": "t10"}})
+
+        saver.delete_thread("t1")
+
+        assert saver.get_tuple({"configurable": {"thread_id": "t1"}}) is None
+        assert graph.get_state({"configurable": {"thread_id": "t10"}}).values["count"] == 6
+
+    def test_async_graph(self, tmp_path):
+        graph = _build(LMDBSaver(str(tmp_path)))
+        configs = [{"configurable": {"thread_id": f"t{n}"}} for n in range(3)]
+
+        results = asyncio.run(
+            graph.abatch([{"items": [], "count": n} for n in range(3)], configs)
+        )
+
+        assert [r["count"] for r in results] == [1, 2, 3]
@@ -1,13 +1,38 @@
 """Tests for the Compiler Node."""
 
+import json
 from unittest.mock import MagicMock, patch
 
+from langchain_core.messages import AIMessageChunk
+
 from api.services.extraction.nodes.compiler import (
     ExtractedKnowledge,
+    acompiler_node,
     compiler_node,
 )
 
 
+def _tool_call_stream(args: dict, chunk_size: int = 20):
+    """Mock streaming LLM emitting the ExtractedKnowledge call in small JSON pieces."""
+    payload = json.dumps(args)
+    pieces = [payload[i:i + chunk_size] for i in range(0, len(payload), chunk_size)]
+    consumed = []
+
+    async def astream(messages):
+        for n, piece in enumerate(pieces):
+            consumed.append(piece)
+            yield AIMessageChunk(content="", tool_call_chunks=[{
+                "name": "ExtractedKnowledge" if n == 0 else None,
+                "args": piece,
+                "id": "call_1" if n == 0 else None,
+                "index": 0,
+            }])
+
+    llm = MagicMock()
+    llm.astream = astream
+    return llm, pieces, consumed
+
+
 class TestExtractedKnowledgeSchema:
     def test_valid_article(self, high_quality_article):
         ek = ExtractedKnowledge(**high_quality_article)
@@ -60,3 +85,64 @@ class TestCompilerNode:
         result = compiler_node(state)
 
         assert result["compiled_article"] is None
+        assert result["compile_failed"] is True
+
+    @patch("api.services.extraction.nodes.compiler._get_structured_llm")
+    def test_retry_served_from_cache(self, mock_get_llm, tech_thread, high_quality_article):
+        mock_llm = MagicMock()
+        mock_llm.invoke.return_value = ExtractedKnowledge(**high_quality_article)
+        mock_get_llm.return_value = mock_llm
+
+        state = {"threads": [tech_thread], "current_thread_idx": 0}
+        first = compiler_node(state)["compiled_article"]
+        first["source_url"] = "https://example.com/thread"
+        result = compiler_node(state)
+        second = result["compiled_article"]
+
+        assert mock_llm.invoke.call_count == 1
+        assert result["compile_failed"] is False
+        assert second["thread_summary"] == first["thread_summary"]
+        # Cached article is not affected by changes to a returned copy
+        assert second["source_url"] is None
+
+    @patch("api.services.extraction.nodes.compiler._get_structured_llm")
+    def test_failure_not_cached(self, mock_get_llm, tech_thread, high_quality_article):
+        mock_llm = MagicMock()
+        mock_llm.invoke.side_effect = [Exception("API error"), ExtractedKnowledge(**high_quality_article)]
+        mock_get_llm.return_value = mock_llm
+
+        state = {"threads": [tech_thread], "current_thread_idx": 0}
+        assert compiler_node(state)["compiled_article"] is None
+        assert compiler_node(state)["compiled_article"] is not None
+
+
+class TestAsyncCompilerNode:
+    @patch("api.services.extraction.nodes.compiler._get_streaming_llm")
+    async def test_streamed_article(self, mock_get_llm, tech_thread, high_quality_article):
+        mock_get_llm.return_value, pieces, consumed = _tool_call_stream(high_quality_article)
+
+        state = {"threads": [tech_thread], "current_thread_idx": 0}
+        result = await acompiler_node(state)
+
+        assert len(consumed) == len(pieces)
+        assert result["compiled_article"]["language"] == "javascript"
+        assert result["compiled_article"]["confidence"] == 0.92
+
+    @patch("api.services.extraction.nodes.compiler._get_streaming_llm")
+    async def test_hopeless_article_stops_stream(self, mock_get_llm, tech_thread, low_quality_article):
+        article = {
+            **low_quality_article,
+            "diagnosis": "unknown",
+            "solution": "try again",
+            "code_snippet": "x" * 400,
+        }
+        mock_get_llm.return_value, pieces, consumed = _tool_call_stream(article)
+
+        state = {"threads": [tech_thread], "current_thread_idx": 0}
+        result = await acompiler_node(state)
+
+        # Short diagnosis + solution cap the score below the threshold before
+        # the long snippet is generated
+        assert len(consumed) < len(pieces)
+        assert result["compiled_article"]["solution"] == "try again"
+        assert "tags" not in result["compiled_article"]
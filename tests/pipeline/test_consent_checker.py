@@ -2,10 +2,17 @@
 
 from unittest.mock import MagicMock, patch
 
-from api.services.consent_checker import filter_consented_messages, get_consented_users
+from api.services.consent_checker import (
+    _consent_cache,
+    filter_consented_messages,
+    get_consented_users,
+)
 
 
 class TestGetConsentedUsers:
+    def setup_method(self):
+        _consent_cache.clear()
+
     @patch("api.services.consent_checker.Session")
     def test_returns_consented_hashes(self, mock_session_cls):
         mock_db = MagicMock()
@@ -25,6 +32,24 @@ class TestGetConsentedUsers:
         result = get_consented_users("server_123")
         assert result == set()
 
+    @patch("api.services.consent_checker._consent_version", return_value=b"1")
+    @patch("api.services.consent_checker.Session")
+    def test_cached_until_consent_version_changes(self, mock_session_cls, mock_version):
+        mock_db = MagicMock()
+        mock_db.execute.return_value.fetchall.return_value = [("hash_aaa",)]
+        mock_session_cls.return_value.__enter__ = MagicMock(return_value=mock_db)
+        mock_session_cls.return_value.__exit__ = MagicMock(return_value=False)
+
+        assert get_consented_users("server_123") == {"hash_aaa"}
+        assert get_consented_users("server_123") == {"hash_aaa"}
+        assert mock_db.execute.call_count == 1
+
+        # A consent change bumps the version: the next lookup hits the DB again
+        mock_version.return_value = b"2"
+        mock_db.execute.return_value.fetchall.return_value = []
+        assert get_consented_users("server_123") == set()
+        assert mock_db.execute.call_count == 2
+
 
 class TestFilterConsentedMessages:
     @patch("api.services.consent_checker.get_consented_users")
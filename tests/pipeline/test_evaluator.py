@@ -21,6 +21,11 @@ class TestParseEvaluation:
         result = _parse_evaluation('```json\n{"has_solution": false, "has_code": false, "is_resolved": false, "reasoning": "no fix"}\n```')
         assert result["is_resolved"] is False
 
+    def test_prose_around_json(self):
+        result = _parse_evaluation('Here is my assessment:\n{"has_solution": true, "is_resolved": true}\nDone.')
+        assert result["has_solution"] is True
+        assert result["is_resolved"] is True
+
     def test_malformed_json_graceful(self):
         result = _parse_evaluation("This is not JSON at all")
         assert result["is_resolved"] is False
@@ -62,6 +67,41 @@ class TestEvaluatorNode:
 
         assert result["evaluation"]["is_resolved"] is False
 
+    @patch("api.services.extraction.nodes.evaluator._get_llm")
+    def test_unchanged_thread_served_from_cache(self, mock_get_llm, tech_thread):
+        mock_llm = MagicMock()
+        mock_llm.invoke.return_value = MagicMock(
+            content='{"has_solution": true, "has_code": true, "is_resolved": true, "reasoning": "ok"}'
+        )
+        mock_get_llm.return_value = mock_llm
+
+        first = evaluator_node({"threads": [tech_thread], "current_thread_idx": 0})
+        second = evaluator_node({"threads": [tech_thread], "current_thread_idx": 0})
+        evaluator_node({"threads": [tech_thread[1:]], "current_thread_idx": 0})
+
+        assert second == first
+        assert mock_llm.invoke.call_count == 2
+
+    @patch("api.services.extraction.nodes.evaluator._get_llm")
+    def test_short_thread_without_code_skips_llm(self, mock_get_llm, tech_thread):
+        short = [tech_thread[1], tech_thread[-1]]  # two messages, no code block
+
+        result = evaluator_node({"threads": [short], "current_thread_idx": 0})
+
+        assert result["evaluation"]["reasoning"] == "structural:too_short"
+        assert result["evaluation"]["has_solution"] is False
+        mock_get_llm.assert_not_called()
+
+    @patch("api.services.extraction.nodes.evaluator._get_llm")
+    def test_short_thread_with_code_is_evaluated(self, mock_get_llm, tech_thread):
+        mock_get_llm.return_value.invoke.return_value = MagicMock(
+            content='{"has_solution": true, "has_code": true, "is_resolved": false, "reasoning": "x"}'
+        )
+
+        result = evaluator_node({"threads": [tech_thread[:2]], "current_thread_idx": 0})
+
+        assert result["evaluation"]["has_solution"] is True
+
 
 class TestRouteAfterEvaluation:
     def test_resolved_with_code_goes_to_compiler(self):
@@ -42,3 +42,10 @@ class TestEvaluatorTypeAwareRouting:
         # Without article_type, falls back to TROUBLESHOOTING logic
         state = {"evaluation": {"has_solution": True, "has_code": False, "is_resolved": False, "reasoning": ""}}
         assert route_after_evaluation(state) == "__end__"  # No code = checkpoint for troubleshooting
+
+    def test_unknown_article_type_follows_troubleshooting(self):
+        state = {"evaluation": {"has_solution": False, "has_code": True, "is_resolved": True, "reasoning": ""}, "article_type": "NOISE"}
+        assert route_after_evaluation(state) == "compiler"
+
+        state = {"evaluation": {"has_solution": False, "has_code": True, "is_resolved": False, "reasoning": ""}, "article_type": "NOISE"}
+        assert route_after_evaluation(state) == "__end__"
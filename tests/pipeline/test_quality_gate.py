@@ -65,12 +65,17 @@ class TestRouteAfterQuality:
         state = {"quality_score": 0.85, "retry_count": 0}
         assert route_after_quality(state) == "__end__"
 
-    def test_fail_retries_compiler(self):
-        state = {"quality_score": 0.3, "retry_count": 1}
+    def test_failed_compile_retries_compiler(self):
+        state = {"quality_score": 0.0, "retry_count": 1, "compile_failed": True}
         assert route_after_quality(state) == "compiler"
 
+    def test_low_score_without_failure_ends(self):
+        # Same thread, temperature 0, cached: a retry would score the same
+        state = {"quality_score": 0.3, "retry_count": 1, "compile_failed": False}
+        assert route_after_quality(state) == "__end__"
+
     def test_max_retries_rejects(self):
-        state = {"quality_score": 0.3, "retry_count": MAX_RETRIES}
+        state = {"quality_score": 0.0, "retry_count": MAX_RETRIES, "compile_failed": True}
         assert route_after_quality(state) == "__end__"
 
     def test_exact_threshold_passes(self):
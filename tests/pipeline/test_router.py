@@ -1,8 +1,10 @@
 """Tests for the Router Node."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from api.services.extraction.nodes.router import (
+    aclassify_threads,
+    arouter_node,
     route_after_classification,
     router_node,
 )
@@ -46,6 +48,50 @@ class TestRouterNode:
         result = router_node(self._make_state([tech_thread]))
         assert result["classification"] == "QUESTION_ANSWER"
 
+    @patch("api.services.extraction.nodes.router._get_llm")
+    def test_keeps_batch_classification(self, mock_get_llm, tech_thread):
+        state = {**self._make_state([tech_thread]), "classification": "GUIDE", "article_type": "GUIDE"}
+        result = router_node(state)
+        assert result == {"classification": "GUIDE", "article_type": "GUIDE"}
+        mock_get_llm.assert_not_called()
+
+    @patch("api.services.extraction.nodes.router._get_llm")
+    async def test_async_classifies(self, mock_get_llm, tech_thread):
+        mock_get_llm.return_value.ainvoke = AsyncMock(
+            return_value=MagicMock(content='{"classification": "TROUBLESHOOTING", "reason": "stack trace"}')
+        )
+        result = await arouter_node(self._make_state([tech_thread]))
+        assert result == {"classification": "TROUBLESHOOTING", "article_type": "TROUBLESHOOTING"}
+
+
+class TestBatchClassification:
+    @patch("api.services.extraction.nodes.router.ROUTER_BATCH_SIZE", 2)
+    @patch("api.services.extraction.nodes.router._get_batch_llm")
+    async def test_classifies_in_chunks(self, mock_get_llm, tech_thread, noise_thread):
+        mock_get_llm.return_value.abatch = AsyncMock(return_value=[
+            MagicMock(content='```json\n[{"idx": 1, "classification": "NOISE"}, {"idx": 0, "classification": "GUIDE"}]\n```'),
+            MagicMock(content='[{"idx": 0, "classification": "TROUBLESHOOTING"}]'),
+        ])
+
+        results = await aclassify_threads([tech_thread, noise_thread, tech_thread])
+
+        assert [r["classification"] for r in results] == ["GUIDE", "NOISE", "TROUBLESHOOTING"]
+        (inputs,), _ = mock_get_llm.return_value.abatch.call_args
+        assert len(inputs) == 2
+        assert "=== THREAD 1 ===" in inputs[0][1].content
+
+    @patch("api.services.extraction.nodes.router._get_batch_llm")
+    async def test_unusable_replies_fall_back(self, mock_get_llm, tech_thread):
+        mock_get_llm.return_value.abatch = AsyncMock(return_value=[
+            MagicMock(content='[{"idx": 0, "classification": "GUIDE"}, {"idx": 7}, "x"]'),
+        ])
+        assert await aclassify_threads([tech_thread, tech_thread]) == [
+            {"classification": "GUIDE", "article_type": "GUIDE"}, None,
+        ]
+
+        mock_get_llm.return_value.abatch = AsyncMock(return_value=[RuntimeError("overloaded")])
+        assert await aclassify_threads([tech_thread, tech_thread]) == [None, None]
+
 
 class TestRouteAfterClassification:
     def test_noise_ends(self):